@@ -1,3 +1,5 @@
+import typing as t
+
 from . import json as json
 from .app import Flask as Flask
 from .blueprints import Blueprint as Blueprint
@@ -11,6 +13,7 @@ from .globals import g as g
 from .globals import request as request
 from .globals import session as session
 from .helpers import abort as abort
+from .helpers import check_etag as check_etag
 from .helpers import flash as flash
 from .helpers import get_flashed_messages as get_flashed_messages
 from .helpers import get_template_attribute as get_template_attribute
@@ -18,6 +21,7 @@ from .helpers import make_response as make_response
 from .helpers import redirect as redirect
 from .helpers import send_file as send_file
 from .helpers import send_from_directory as send_from_directory
+from .helpers import single_flight as single_flight
 from .helpers import stream_with_context as stream_with_context
 from .helpers import url_for as url_for
 from .json import jsonify as jsonify
@@ -31,9 +35,95 @@ from .signals import request_finished as request_finished
 from .signals import request_started as request_started
 from .signals import request_tearing_down as request_tearing_down
 from .signals import template_rendered as template_rendered
-from .templating import render_template as render_template
-from .templating import render_template_string as render_template_string
-from .templating import stream_template as stream_template
-from .templating import stream_template_string as stream_template_string
 from .wrappers import Request as Request
 from .wrappers import Response as Response
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from .templating import render_template as render_template
+    from .templating import render_template_async as render_template_async
+    from .templating import render_template_string as render_template_string
+    from .templating import stream_template as stream_template
+    from .templating import stream_template_async as stream_template_async
+    from .templating import stream_template_string as stream_template_string
+
+__all__ = [
+    "abort",
+    "after_this_request",
+    "appcontext_popped",
+    "appcontext_pushed",
+    "appcontext_tearing_down",
+    "before_render_template",
+    "Blueprint",
+    "check_etag",
+    "Config",
+    "copy_current_request_context",
+    "current_app",
+    "flash",
+    "Flask",
+    "g",
+    "get_flashed_messages",
+    "get_template_attribute",
+    "got_request_exception",
+    "has_app_context",
+    "has_request_context",
+    "json",
+    "jsonify",
+    "make_response",
+    "message_flashed",
+    "redirect",
+    "render_template",
+    "render_template_async",
+    "render_template_string",
+    "request",
+    "Request",
+    "request_finished",
+    "request_started",
+    "request_tearing_down",
+    "Response",
+    "send_file",
+    "send_from_directory",
+    "session",
+    "single_flight",
+    "stream_template",
+    "stream_template_async",
+    "stream_template_string",
+    "stream_with_context",
+    "template_rendered",
+    "url_for",
+]
+
+# Names imported from submodules that import Jinja when they are first
+# accessed, rather than when Flask is imported.
+_lazy_names = {
+    "render_template": "templating",
+    "render_template_async": "templating",
+    "render_template_string": "templating",
+    "stream_template": "templating",
+    "stream_template_async": "templating",
+    "stream_template_string": "templating",
+}
+
+# Submodules that are imported when they are first accessed as attributes,
+# such as ``flask.cli`` after only ``import flask``.
+_lazy_modules = {"cli", "debughelpers", "templating", "testing"}
+
+
+def __getattr__(name: str) -> t.Any:
+    if name in _lazy_names:
+        import importlib
+
+        module = importlib.import_module(f".{_lazy_names[name]}", __name__)
+        return getattr(module, name)
+
+    if name in _lazy_modules:
+        import importlib
+
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    import sys
+
+    return sorted({*vars(sys.modules[__name__]), *_lazy_names, *_lazy_modules})
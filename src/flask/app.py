@@ -13,7 +13,6 @@ from itertools import chain
 from types import TracebackType
 from urllib.parse import quote as _url_quote
 
-import click
 from werkzeug.datastructures import Headers
 from werkzeug.datastructures import ImmutableDict
 from werkzeug.exceptions import BadRequestKeyError
@@ -25,12 +24,20 @@ from werkzeug.routing import RequestRedirect
 from werkzeug.routing import RoutingException
 from werkzeug.routing import Rule
 from werkzeug.serving import is_running_from_reloader
+from werkzeug.utils import cached_property
 from werkzeug.wrappers import Response as BaseResponse
 from werkzeug.wsgi import get_host
 
-from . import cli
 from . import typing as ft
+from .caching import _get_response
+from .caching import _set_response
+from .caching import Cache
+from .caching import FileSystemCache
+from .caching import MemoryCache
+from .compression import compress_response
 from .ctx import AppContext
+from .flashing import FlashInterface
+from .flashing import SessionFlashInterface
 from .globals import _cv_app
 from .globals import app_ctx
 from .globals import g
@@ -39,7 +46,6 @@ from .globals import session
 from .helpers import get_debug_flag
 from .helpers import get_flashed_messages
 from .helpers import get_load_dotenv
-from .helpers import send_from_directory
 from .sansio.app import App
 from .sessions import SecureCookieSessionInterface
 from .sessions import SessionInterface
@@ -48,7 +54,11 @@ from .signals import got_request_exception
 from .signals import request_finished
 from .signals import request_started
 from .signals import request_tearing_down
-from .templating import Environment
+from .static import _send_static_file
+from .static import FilePathCache
+from .static import MappedFileCache
+from .static import StaticFileCache
+from .static import StaticManifest
 from .wrappers import Request
 from .wrappers import Response
 
@@ -56,6 +66,9 @@ if t.TYPE_CHECKING:  # pragma: no cover
     from _typeshed.wsgi import StartResponse
     from _typeshed.wsgi import WSGIEnvironment
 
+    from .cli import AppGroup
+    from .sansio.scaffold import Scaffold
+    from .templating import Environment
     from .testing import FlaskClient
     from .testing import FlaskCliRunner
     from .typing import HeadersValue
@@ -226,13 +239,46 @@ class Flask(App):
             "MAX_FORM_MEMORY_SIZE": 500_000,
             "MAX_FORM_PARTS": 1_000,
             "SEND_FILE_MAX_AGE_DEFAULT": None,
+            "SEND_FILE_PRECOMPRESSED": False,
+            "SEND_FILE_MMAP_CACHE_SIZE": None,
+            "SEND_FILE_MMAP_MIN_SIZE": 1_048_576,
+            "SEND_FILE_PATH_CACHE_TTL": None,
+            "SEND_FILE_PATH_CACHE_NOT_FOUND_TTL": 1,
+            "STATIC_FILE_CACHE_SIZE": None,
+            "STATIC_FILE_CACHE_MAX_FILE_SIZE": 1_048_576,
+            "STATIC_HASHED_URLS": False,
             "TRAP_BAD_REQUEST_ERRORS": None,
             "TRAP_HTTP_EXCEPTIONS": False,
             "EXPLAIN_TEMPLATE_LOADING": False,
             "PREFERRED_URL_SCHEME": "http",
             "TEMPLATES_AUTO_RELOAD": None,
+            "TEMPLATES_AUTO_RELOAD_INTERVAL": None,
+            "TEMPLATES_BYTECODE_CACHE": None,
+            "TEMPLATES_STREAM_BUFFER_SIZE": None,
             "MAX_COOKIE_SIZE": 4093,
             "PROVIDE_AUTOMATIC_OPTIONS": True,
+            "COMPRESS_RESPONSES": False,
+            "COMPRESS_LEVEL": 6,
+            "COMPRESS_MIN_SIZE": 500,
+            "COMPRESS_MIMETYPES": frozenset(
+                {
+                    "application/javascript",
+                    "application/json",
+                    "application/x-ndjson",
+                    "application/xml",
+                    "image/svg+xml",
+                    "text/css",
+                    "text/csv",
+                    "text/html",
+                    "text/javascript",
+                    "text/plain",
+                    "text/xml",
+                }
+            ),
+            "RESPONSE_CACHE_SIZE": 10_485_760,
+            "RESPONSE_CACHE_DIR": None,
+            "ETAG_RESPONSES": False,
+            "ETAG_WEAK": False,
         }
     )
 
@@ -250,6 +296,13 @@ class Flask(App):
     #: .. versionadded:: 0.8
     session_interface: SessionInterface = SecureCookieSessionInterface()
 
+    #: The interface used to store flashed messages. By default an instance of
+    #: :class:`~flask.flashing.SessionFlashInterface` is used, which stores
+    #: messages in the session.
+    #:
+    #: .. versionadded:: 3.2
+    flash_interface: FlashInterface = SessionFlashInterface()
+
     def __init_subclass__(cls, **kwargs: t.Any) -> None:
         import warnings
 
@@ -332,16 +385,6 @@ class Flask(App):
             root_path=root_path,
         )
 
-        #: The Click command group for registering CLI commands for this
-        #: object. The commands are available from the ``flask`` command
-        #: once the application has been discovered and blueprints have
-        #: been registered.
-        self.cli = cli.AppGroup()
-
-        # Set the name of the Click group in case someone wants to add
-        # the app's commands to another CLI tool.
-        self.cli.name = self.name
-
         # Add a static route using the provided static_url_path, static_host,
         # and static_folder if there is a configured static_folder.
         # Note we do this without checking if static_folder exists.
@@ -388,6 +431,151 @@ class Flask(App):
 
         return value  # type: ignore[no-any-return]
 
+    @cached_property
+    def cli(self) -> AppGroup:
+        """The Click command group for registering CLI commands for this
+        object. The commands are available from the ``flask`` command
+        once the application has been discovered and blueprints have
+        been registered.
+
+        .. versionchanged:: 3.2
+            Created the first time it is accessed, so that Click is only
+            imported if it is used.
+        """
+        from .cli import AppGroup
+
+        rv = AppGroup()
+        # Set the name of the Click group in case someone wants to add
+        # the app's commands to another CLI tool.
+        rv.name = self.name
+        return rv
+
+    @cached_property
+    def static_file_cache(self) -> StaticFileCache | None:
+        """The :class:`~flask.static.StaticFileCache` used to serve files
+        from the app and blueprint static folders from memory. This is
+        ``None`` unless the ``STATIC_FILE_CACHE_SIZE`` config is set. It is
+        created the first time it is accessed, from the config at that time.
+
+        .. versionadded:: 3.2
+        """
+        max_size = self.config["STATIC_FILE_CACHE_SIZE"]
+
+        if not max_size:
+            return None
+
+        return StaticFileCache(max_size, self.config["STATIC_FILE_CACHE_MAX_FILE_SIZE"])
+
+    @cached_property
+    def mapped_file_cache(self) -> MappedFileCache | None:
+        """The :class:`~flask.static.MappedFileCache` used to send large
+        files from memory mappings. This is ``None`` unless the
+        ``SEND_FILE_MMAP_CACHE_SIZE`` config is set. It is created the first
+        time it is accessed, from the config at that time.
+
+        .. versionadded:: 3.2
+        """
+        max_entries = self.config["SEND_FILE_MMAP_CACHE_SIZE"]
+
+        if not max_entries:
+            return None
+
+        return MappedFileCache(max_entries, self.config["SEND_FILE_MMAP_MIN_SIZE"])
+
+    @cached_property
+    def send_file_path_cache(self) -> FilePathCache | None:
+        """The :class:`~flask.static.FilePathCache` used by
+        :func:`~flask.send_from_directory` to remember resolved paths. This
+        is ``None`` unless the ``SEND_FILE_PATH_CACHE_TTL`` config is set. It
+        is created the first time it is accessed, from the config at that
+        time.
+
+        .. versionadded:: 3.2
+        """
+        ttl = self.config["SEND_FILE_PATH_CACHE_TTL"]
+
+        if not ttl:
+            return None
+
+        return FilePathCache(ttl, self.config["SEND_FILE_PATH_CACHE_NOT_FOUND_TTL"])
+
+    @cached_property
+    def static_manifest(self) -> StaticManifest | None:
+        """The :class:`~flask.static.StaticManifest` used to add content
+        hashes to static file URLs. This is ``None`` unless the
+        ``STATIC_HASHED_URLS`` config is enabled. It is created the first
+        time it is accessed, from the config at that time.
+
+        .. versionadded:: 3.2
+        """
+        if not self.config["STATIC_HASHED_URLS"]:
+            return None
+
+        return StaticManifest()
+
+    @cached_property
+    def response_cache(self) -> Cache:
+        """The :class:`~flask.caching.Cache` used to store responses from
+        views decorated with :meth:`cache_response`. If the
+        ``RESPONSE_CACHE_DIR`` config is set, this is a
+        :class:`~flask.caching.FileSystemCache` shared by every process using
+        that directory, otherwise it is a :class:`~flask.caching.MemoryCache`
+        limited to ``RESPONSE_CACHE_SIZE`` bytes. It is created the first
+        time it is accessed, from the config at that time. Assign a
+        different cache to use another backend.
+
+        .. versionadded:: 3.2
+        """
+        if (directory := self.config["RESPONSE_CACHE_DIR"]) is not None:
+            return FileSystemCache(directory, default_timeout=0)
+
+        return MemoryCache(
+            max_entries=None,
+            default_timeout=0,
+            max_size=self.config["RESPONSE_CACHE_SIZE"],
+        )
+
+    def cache_response(self, ttl: float = 300) -> t.Callable[[F], F]:
+        """Decorate a view function to store its finished responses in
+        :attr:`response_cache` for ``ttl`` seconds.
+
+        .. code-block:: python
+
+            @app.route("/products/<int:id>")
+            @app.cache_response(ttl=60)
+            def product(id):
+                ...
+
+        Responses are stored by request method, host, path, query string,
+        and the values of the request headers named in the response's
+        ``Vary`` header. Cookies other than the session, and the
+        ``Authorization`` header, are not part of the key. A view that
+        depends on them must add those headers to ``Vary``, or must not be
+        cached. When a stored response is found, it is returned without
+        calling the view, :meth:`make_response`, or any
+        :meth:`after_request` functions, and the session is not saved.
+        :meth:`before_request` functions are still called first, and the
+        :data:`.request_finished` signal is still sent.
+
+        Only successful ``GET`` and ``HEAD`` responses are stored. They are
+        not stored if they are streamed, set a cookie, have
+        ``Cache-Control: private`` or ``no-store``, or if the session was
+        accessed during the request. The cache is not used if a
+        ``before_request`` function accessed the session. If the request has
+        an ``Authorization`` header, a response is only stored or returned
+        if it has ``Cache-Control: public``.
+
+        :param ttl: How long to store responses for, in seconds.
+
+        .. versionadded:: 3.2
+        """
+
+        def decorator(f: F) -> F:
+            f.cache_response_ttl = ttl  # type: ignore[attr-defined]
+            return f
+
+        return decorator
+
     def send_static_file(self, filename: str) -> Response:
         """The view function used to serve files from
         :attr:`static_folder`. A route is automatically registered for
@@ -397,6 +585,10 @@ class Flask(App):
         Note this is a duplicate of the same method in the Flask
         class.
 
+        .. versionchanged:: 3.2
+            Uses :attr:`.Flask.static_file_cache` and
+            :attr:`.Flask.static_manifest` if they are enabled.
+
         .. versionadded:: 0.5
 
         """
@@ -406,9 +598,7 @@ class Flask(App):
         # send_file only knows to call get_send_file_max_age on the app,
         # call it here so it works for blueprints too.
         max_age = self.get_send_file_max_age(filename)
-        return send_from_directory(
-            t.cast(str, self.static_folder), filename, max_age=max_age
-        )
+        return _send_static_file(t.cast(str, self.static_folder), filename, max_age)
 
     def open_resource(
         self, resource: str, mode: str = "rb", encoding: str | None = None
@@ -471,12 +661,23 @@ class Flask(App):
         :attr:`jinja_options` after this will have no effect. Also adds
         Flask-related globals and filters to the environment.
 
+        .. versionchanged:: 3.2
+           ``Environment.bytecode_cache`` set in accordance with
+           ``TEMPLATES_BYTECODE_CACHE`` configuration option.
+
+        .. versionchanged:: 3.2
+           ``Environment.template_watcher`` set in accordance with
+           ``TEMPLATES_AUTO_RELOAD_INTERVAL`` configuration option.
+
         .. versionchanged:: 0.11
            ``Environment.auto_reload`` set in accordance with
            ``TEMPLATES_AUTO_RELOAD`` configuration option.
 
         .. versionadded:: 0.5
         """
+        from .templating import stream_flush
+        from .templating import TemplateWatcher
+
         options = dict(self.jinja_options)
 
         if "autoescape" not in options:
@@ -490,7 +691,23 @@ class Flask(App):
 
             options["auto_reload"] = auto_reload
 
+        if "bytecode_cache" not in options:
+            bytecode_cache = self.config["TEMPLATES_BYTECODE_CACHE"]
+
+            if isinstance(bytecode_cache, (str, os.PathLike)):
+                from jinja2 import FileSystemBytecodeCache
+
+                path = os.path.join(self.instance_path, bytecode_cache)
+                os.makedirs(path, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(path)
+
+            options["bytecode_cache"] = bytecode_cache
+
         rv = self.jinja_environment(self, **options)
+
+        if (interval := self.config["TEMPLATES_AUTO_RELOAD_INTERVAL"]) is not None:
+            rv.template_watcher = TemplateWatcher(interval)
+
         rv.globals.update(
             url_for=self.url_for,
             get_flashed_messages=get_flashed_messages,
@@ -501,6 +718,7 @@ class Flask(App):
             request=request,
             session=session,
             g=g,
+            stream_flush=stream_flush,
         )
         rv.policies["json.dumps_function"] = self.json.dumps
         return rv
@@ -599,6 +817,47 @@ class Flask(App):
         :param context: the context as a dictionary that is updated in place
                         to add extra variables.
         """
+        for func in self._template_context_processors(ctx, context):
+            context.update(self.ensure_sync(func)())
+
+    async def update_template_context_async(
+        self, ctx: AppContext, context: dict[str, t.Any]
+    ) -> None:
+        """Like :meth:`update_template_context`, but awaits async template
+        context processors instead of running them with :meth:`ensure_sync`.
+        Used by :func:`render_template_async`.
+
+        :class:`~flask.templating.LazyValue` values that wrap an async
+        function are awaited here, before rendering, even if the template
+        doesn't use them. Jinja doesn't await a variable when it is
+        accessed, so they can't be computed on first use like other lazy
+        values. Sync lazy values are still only called if they are used.
+
+        :param context: the context as a dictionary that is updated in place
+                        to add extra variables.
+
+        .. versionadded:: 3.2
+        """
+        for func in self._template_context_processors(ctx, context):
+            rv = func()
+
+            if inspect.isawaitable(rv):
+                rv = await rv
+
+            context.update(rv)
+
+        from .templating import LazyValue
+
+        for value in context.values():
+            if isinstance(value, LazyValue) and iscoroutinefunction(value.func):
+                await value.resolve_async()
+
+    def _template_context_processors(
+        self, ctx: AppContext, context: dict[str, t.Any]
+    ) -> t.Iterator[ft.TemplateContextProcessorCallable]:
+        # Yield the context processors to call for the current blueprints.
+        # The caller updates the context with each result. Once all have
+        # been yielded, the original values are applied again.
         names: t.Iterable[str | None] = (None,)
 
         # A template may be rendered outside a request context.
@@ -611,8 +870,7 @@ class Flask(App):
 
         for name in names:
             if name in self.template_context_processors:
-                for func in self.template_context_processors[name]:
-                    context.update(self.ensure_sync(func)())
+                yield from self.template_context_processors[name]
 
         context.update(orig_ctx)
 
@@ -693,8 +951,12 @@ class Flask(App):
         """
         # Ignore this call so that it doesn't start another server if
         # the 'flask run' command is used.
+        from . import cli
+
         if os.environ.get("FLASK_RUN_FROM_CLI") == "true":
             if not is_running_from_reloader():
+                import click
+
                 click.secho(
                     " * Ignoring a call to 'app.run()' that would block"
                     " the current 'flask' CLI command.\n"
@@ -993,18 +1255,75 @@ class Flask(App):
         pre and postprocessing as well as HTTP exception catching and
         error handling.
 
+        .. versionchanged:: 3.2
+            Returns a stored response for views decorated with
+            :meth:`cache_response`.
+
         .. versionadded:: 0.7
         """
         self._got_first_request = True
+        ttl = self._get_cache_response_ttl(ctx)
 
         try:
             request_started.send(self, _async_wrapper=self.ensure_sync)
             rv = self.preprocess_request(ctx)
             if rv is None:
+                if ttl is not None and not self._session_accessed(ctx):
+                    value = _get_response(self.response_cache, ctx.request)
+
+                    if value is not None:
+                        status, headers, body = value
+                        response = self.response_class(body, status, headers)
+
+                        if self._can_share_response(ctx, response):
+                            response = response.make_conditional(ctx.request)
+                            request_finished.send(
+                                self,
+                                _async_wrapper=self.ensure_sync,
+                                response=response,
+                            )
+                            return response
+
                 rv = self.dispatch_request(ctx)
         except Exception as e:
             rv = self.handle_user_exception(ctx, e)
-        return self.finalize_request(ctx, rv)
+
+        response = self.finalize_request(ctx, rv)
+
+        if (
+            ttl is not None
+            and response.status_code == 200
+            and not response.is_streamed
+            and not response.direct_passthrough
+            and "Set-Cookie" not in response.headers
+            and not response.cache_control.private
+            and not response.cache_control.no_store
+            and "*" not in response.vary
+            and not self._session_accessed(ctx)
+            and self._can_share_response(ctx, response)
+        ):
+            _set_response(self.response_cache, ctx.request, response, ttl)
+
+        return response
+
+    def _get_cache_response_ttl(self, ctx: AppContext) -> float | None:
+        req = ctx.request
+
+        if req.method not in {"GET", "HEAD"} or req.url_rule is None:
+            return None
+
+        view = self.view_functions.get(req.url_rule.endpoint)
+        return getattr(view, "cache_response_ttl", None)
+
+    def _session_accessed(self, ctx: AppContext) -> bool:
+        return ctx._session is not None and ctx._session.accessed
+
+    def _can_share_response(self, ctx: AppContext, response: Response) -> bool:
+        # Credentials aren't part of the key, so a response to a request
+        # that sent them is only shared if it was explicitly marked public.
+        return (
+            "Authorization" not in ctx.request.headers or response.cache_control.public
+        )
 
     def finalize_request(
         self,
@@ -1189,6 +1508,9 @@ class Flask(App):
 
         self.inject_url_defaults(endpoint, values)
 
+        if (manifest := self.static_manifest) is not None and "filename" in values:
+            self._add_static_hash(manifest, endpoint, values)
+
         try:
             rv = url_adapter.build(  # type: ignore[union-attr]
                 endpoint,
@@ -1209,6 +1531,24 @@ class Flask(App):
 
         return rv
 
+    def _add_static_hash(
+        self, manifest: StaticManifest, endpoint: str, values: dict[str, t.Any]
+    ) -> None:
+        """Replace the ``filename`` value for a ``static`` endpoint with
+        the name that includes the file's content hash.
+        """
+        name, _, view = endpoint.rpartition(".")
+
+        if view != "static":
+            return
+
+        scaffold: Scaffold | None = self.blueprints.get(name) if name else self
+
+        if scaffold is not None and scaffold.has_static_folder:
+            values["filename"] = manifest.get_url_filename(
+                t.cast(str, scaffold.static_folder), os.fspath(values["filename"])
+            )
+
     def make_response(self, rv: ft.ResponseReturnValue) -> Response:
         """Convert the return value from a view function to an instance of
         :attr:`response_class`.
@@ -1384,6 +1724,14 @@ class Flask(App):
         before it's sent to the WSGI server.  By default this will
         call all the :meth:`after_request` decorated functions.
 
+        .. versionchanged:: 3.2
+           Adds an ETag and handles ``If-None-Match`` if the
+           ``ETAG_RESPONSES`` config is enabled.
+
+        .. versionchanged:: 3.2
+           Compresses the response if the ``COMPRESS_RESPONSES`` config is
+           enabled.
+
         .. versionchanged:: 0.5
            As of Flask 0.5 the functions registered for after request
            execution are called in reverse order of registration.
@@ -1400,9 +1748,32 @@ class Flask(App):
                 for func in reversed(self.after_request_funcs[name]):
                     response = self.ensure_sync(func)(response)
 
+        self.flash_interface.save_flashes(ctx, response)
+
         if not self.session_interface.is_null_session(ctx.session):
             self.session_interface.save_session(self, ctx.session, response)
 
+        # Hash the body before it is compressed, so the ETag is the same for
+        # every content encoding.
+        if (
+            self.config["ETAG_RESPONSES"]
+            and ctx.request.method in {"GET", "HEAD"}
+            and response.status_code == 200
+            and not response.is_streamed
+            and not response.direct_passthrough
+        ):
+            response.add_etag(weak=self.config["ETAG_WEAK"])
+            response = response.make_conditional(ctx.request)
+
+        if self.config["COMPRESS_RESPONSES"]:
+            response = compress_response(
+                ctx.request,
+                response,
+                level=self.config["COMPRESS_LEVEL"],
+                min_size=self.config["COMPRESS_MIN_SIZE"],
+                mimetypes=self.config["COMPRESS_MIMETYPES"],
+            )
+
         return response
 
     def do_teardown_request(
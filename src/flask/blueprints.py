@@ -4,53 +4,37 @@ import os
 import typing as t
 from datetime import timedelta
 
-from .cli import AppGroup
+from werkzeug.utils import cached_property
+
 from .globals import current_app
-from .helpers import send_from_directory
 from .sansio.blueprints import Blueprint as SansioBlueprint
 from .sansio.blueprints import BlueprintSetupState as BlueprintSetupState  # noqa
-from .sansio.scaffold import _sentinel
+from .static import _send_static_file
 
 if t.TYPE_CHECKING:  # pragma: no cover
+    from .cli import AppGroup
     from .wrappers import Response
 
 
 class Blueprint(SansioBlueprint):
-    def __init__(
-        self,
-        name: str,
-        import_name: str,
-        static_folder: str | os.PathLike[str] | None = None,
-        static_url_path: str | None = None,
-        template_folder: str | os.PathLike[str] | None = None,
-        url_prefix: str | None = None,
-        subdomain: str | None = None,
-        url_defaults: dict[str, t.Any] | None = None,
-        root_path: str | None = None,
-        cli_group: str | None = _sentinel,  # type: ignore
-    ) -> None:
-        super().__init__(
-            name,
-            import_name,
-            static_folder,
-            static_url_path,
-            template_folder,
-            url_prefix,
-            subdomain,
-            url_defaults,
-            root_path,
-            cli_group,
-        )
-
-        #: The Click command group for registering CLI commands for this
-        #: object. The commands are available from the ``flask`` command
-        #: once the application has been discovered and blueprints have
-        #: been registered.
-        self.cli = AppGroup()
+    @cached_property
+    def cli(self) -> AppGroup:
+        """The Click command group for registering CLI commands for this
+        object. The commands are available from the ``flask`` command
+        once the application has been discovered and blueprints have
+        been registered.
+
+        .. versionchanged:: 3.2
+            Created the first time it is accessed, so that Click is only
+            imported if it is used.
+        """
+        from .cli import AppGroup
 
+        rv = AppGroup()
         # Set the name of the Click group in case someone wants to add
         # the app's commands to another CLI tool.
-        self.cli.name = self.name
+        rv.name = self.name
+        return rv
 
     def get_send_file_max_age(self, filename: str | None) -> int | None:
         """Used by :func:`send_file` to determine the ``max_age`` cache
@@ -88,6 +72,10 @@ class Blueprint(SansioBlueprint):
         Note this is a duplicate of the same method in the Flask
         class.
 
+        .. versionchanged:: 3.2
+            Uses :attr:`.Flask.static_file_cache` and
+            :attr:`.Flask.static_manifest` if they are enabled.
+
         .. versionadded:: 0.5
 
         """
@@ -97,9 +85,7 @@ class Blueprint(SansioBlueprint):
         # send_file only knows to call get_send_file_max_age on the app,
         # call it here so it works for blueprints too.
         max_age = self.get_send_file_max_age(filename)
-        return send_from_directory(
-            t.cast(str, self.static_folder), filename, max_age=max_age
-        )
+        return _send_static_file(t.cast(str, self.static_folder), filename, max_age)
 
     def open_resource(
         self, resource: str, mode: str = "rb", encoding: str | None = "utf-8"
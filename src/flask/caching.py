@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from .wrappers import Request
+    from .wrappers import Response
+
+
+class Cache:
+    """The basic interface for a cache backend used by Flask's caching
+    features, such as the ``{% cache %}`` template tag.
+
+    Values are stored with an optional timeout in seconds. A timeout of
+    ``None`` uses the backend's default timeout, and ``0`` means the value
+    does not expire.
+
+    .. versionadded:: 3.2
+    """
+
+    def get(self, key: str) -> t.Any | None:
+        """Get the value stored for a key, or ``None`` if it is missing or
+        has expired.
+        """
+        raise NotImplementedError()
+
+    def set(self, key: str, value: t.Any, timeout: float | None = None) -> None:
+        """Store a value for a key, replacing any existing value."""
+        raise NotImplementedError()
+
+    def delete(self, key: str) -> None:
+        """Remove the value stored for a key, if any."""
+        raise NotImplementedError()
+
+    def clear(self) -> None:
+        """Remove all stored values."""
+        raise NotImplementedError()
+
+
+class MemoryCache(Cache):
+    """Store values in memory in the current process. When more than
+    ``max_entries`` values are stored, or the stored values are larger than
+    ``max_size`` bytes in total, the least recently used values are removed.
+
+    The size of a ``bytes`` or ``str`` value is its length, the size of any
+    other value is the length of its pickled data.
+
+    :param max_entries: The maximum number of values to store. ``None``
+        means there is no limit.
+    :param default_timeout: The timeout used if ``set`` isn't given one.
+        ``0`` means values don't expire.
+    :param max_size: The maximum total size of the stored values in bytes.
+        ``None`` means there is no limit.
+
+    .. versionadded:: 3.2
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = 500,
+        default_timeout: float = 300,
+        max_size: int | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.default_timeout = default_timeout
+        self.max_size = max_size
+        self._data: OrderedDict[str, tuple[float, t.Any, int]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _get_size(self, value: t.Any) -> int:
+        if self.max_size is None:
+            return 0
+
+        if isinstance(value, (bytes, str)):
+            return len(value)
+
+        return len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+    def get(self, key: str) -> t.Any | None:
+        with self._lock:
+            try:
+                expires, value, _ = self._data[key]
+            except KeyError:
+                return None
+
+            if expires and expires < time.monotonic():
+                self._pop(key)
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def _pop(self, key: str) -> None:
+        if (item := self._data.pop(key, None)) is not None:
+            self._size -= item[2]
+
+    def set(self, key: str, value: t.Any, timeout: float | None = None) -> None:
+        if timeout is None:
+            timeout = self.default_timeout
+
+        expires = time.monotonic() + timeout if timeout else 0
+        size = self._get_size(value)
+
+        with self._lock:
+            self._pop(key)
+
+            if self.max_size is not None and size > self.max_size:
+                return
+
+            self._data[key] = (expires, value, size)
+            self._size += size
+
+            while (
+                self.max_entries is not None and len(self._data) > self.max_entries
+            ) or (self.max_size is not None and self._size > self.max_size):
+                self._size -= self._data.popitem(last=False)[1][2]
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+
+
+class FileSystemCache(Cache):
+    """Store values as pickled files in a directory. Every process on the
+    host that uses the same directory shares the stored values. Expired
+    files are removed when they are read.
+
+    Only use a directory that is not writable by untrusted users, since
+    the values are loaded with :mod:`pickle`.
+
+    :param directory: The directory to store values in. It is created if
+        it doesn't exist.
+    :param default_timeout: The timeout used if ``set`` isn't given one.
+        ``0`` means values don't expire.
+
+    .. versionadded:: 3.2
+    """
+
+    def __init__(
+        self, directory: str | os.PathLike[str], default_timeout: float = 300
+    ) -> None:
+        self.directory = os.fspath(directory)
+        self.default_timeout = default_timeout
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _get_path(self, key: str) -> str:
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.directory, name)
+
+    def get(self, key: str) -> t.Any | None:
+        path = self._get_path(key)
+
+        try:
+            with open(path, "rb") as f:
+                expires, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+        # Use wall time, monotonic time is not shared between processes.
+        if expires and expires < time.time():
+            self.delete(key)
+            return None
+
+        return value
+
+    def set(self, key: str, value: t.Any, timeout: float | None = None) -> None:
+        if timeout is None:
+            timeout = self.default_timeout
+
+        expires = time.time() + timeout if timeout else 0
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((expires, value), f, pickle.HIGHEST_PROTOCOL)
+
+            # Replace atomically, other processes never see a partial file.
+            os.replace(tmp, self._get_path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._get_path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+
+
+def _response_key(prefix: str, request: Request, vary: tuple[str, ...]) -> str:
+    parts = [
+        request.method,
+        request.host,
+        request.path,
+        request.query_string.decode("latin1"),
+    ]
+    parts.extend(request.headers.get(name, "") for name in vary)
+    value = "\0".join(parts).encode("utf-8", "replace")
+    return f"{prefix}:{hashlib.sha256(value).hexdigest()}"
+
+
+def _get_response(cache: Cache, request: Request) -> t.Any | None:
+    # The headers the response varies on are only known after the first
+    # response, so they are stored separately under a key without them.
+    vary = cache.get(_response_key("response-vary", request, ()))
+
+    if vary is None:
+        return None
+
+    return cache.get(_response_key("response", request, vary))
+
+
+def _set_response(
+    cache: Cache, request: Request, response: Response, timeout: float
+) -> None:
+    vary = tuple(sorted({name.lower() for name in response.vary}))
+    value = (response.status_code, response.headers.to_wsgi_list(), response.data)
+    cache.set(_response_key("response", request, vary), value, timeout)
+    cache.set(_response_key("response-vary", request, ()), vary, timeout)
@@ -2,14 +2,17 @@ from __future__ import annotations
 
 import ast
 import collections.abc as cabc
+import gzip
 import importlib.metadata
 import inspect
+import json
 import os
 import platform
 import re
 import sys
 import traceback
 import typing as t
+from concurrent.futures import ProcessPoolExecutor
 from functools import update_wrapper
 from operator import itemgetter
 from types import ModuleType
@@ -23,6 +26,8 @@ from werkzeug.utils import import_string
 from .globals import current_app
 from .helpers import get_debug_flag
 from .helpers import get_load_dotenv
+from .static import _hash_file
+from .static import StaticManifest
 
 if t.TYPE_CHECKING:
     import ssl
@@ -594,6 +599,8 @@ class FlaskGroup(AppGroup):
             self.add_command(run_command)
             self.add_command(shell_command)
             self.add_command(routes_command)
+            self.add_command(templates_cli)
+            self.add_command(static_cli)
 
         self._loaded_plugin_commands = False
 
@@ -1107,6 +1114,201 @@ def routes_command(sort: str, all_methods: bool) -> None:
         click.echo(template.format(*row))
 
 
+templates_cli = AppGroup("templates", help="Work with the app's templates.")
+
+
+def _compile_template(env: t.Any, name: str) -> str | None:
+    try:
+        env.get_template(name)
+    except Exception as e:
+        return str(e)
+
+    return None
+
+
+def _compile_templates(
+    app_import_path: str | None, names: list[str]
+) -> list[tuple[str, str | None]]:
+    # Runs in a worker process, which loads its own instance of the app.
+    app = ScriptInfo(app_import_path).load_app()
+
+    with app.app_context():
+        env = app.jinja_env
+        return [(name, _compile_template(env, name)) for name in names]
+
+
+@templates_cli.command("compile", short_help="Compile all templates.")
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Number of processes to compile templates in. Defaults to the CPU count.",
+)
+@pass_script_info
+def templates_compile_command(info: ScriptInfo, jobs: int | None) -> None:
+    """Compile every template in the app and blueprint template folders.
+
+    If the TEMPLATES_BYTECODE_CACHE config is set, the compiled templates
+    are stored there, so that new processes don't need to compile them
+    again. Run this while deploying to start workers with a warm cache.
+
+    Templates are compiled in parallel by worker processes that each load
+    the app. If the app is created by a custom FlaskGroup's create_app,
+    workers can't load it, and templates are compiled in this process.
+    """
+    env = current_app.jinja_env
+    names = sorted(env.list_templates())
+    jobs = min(jobs or os.cpu_count() or 1, len(names))
+
+    if jobs > 1 and info.create_app is None:
+        with ProcessPoolExecutor(jobs) as executor:
+            futures = [
+                executor.submit(
+                    _compile_templates, info.app_import_path, names[i::jobs]
+                )
+                for i in range(jobs)
+            ]
+            errors = dict(item for f in futures for item in f.result())
+    else:
+        errors = {name: _compile_template(env, name) for name in names}
+
+    failed = 0
+
+    for name in names:
+        if (error := errors[name]) is not None:
+            failed += 1
+            click.echo(f"Failed to compile {name!r}: {error}", err=True)
+
+    click.echo(f"Compiled {len(names) - failed} templates.")
+
+    if env.bytecode_cache is None:
+        click.echo(
+            "TEMPLATES_BYTECODE_CACHE is not set, the compiled templates were"
+            " not stored.",
+            err=True,
+        )
+
+    if failed:
+        raise click.ClickException(f"{failed} templates failed to compile.")
+
+
+static_cli = AppGroup("static", help="Work with the app's static files.")
+
+
+def _get_static_folders(app: Flask) -> list[str]:
+    return sorted(
+        {
+            t.cast(str, scaffold.static_folder)
+            for scaffold in (app, *app.blueprints.values())
+            if scaffold.has_static_folder
+        }
+    )
+
+
+@static_cli.command("compress", short_help="Precompress static files.")
+@click.option(
+    "--min-size",
+    default=1024,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Don't compress files smaller than this many bytes.",
+)
+def static_compress_command(min_size: int) -> None:
+    """Write compressed copies of the files in the app and blueprint static
+    folders, such as "app.js.gz" next to "app.js".
+
+    With the SEND_FILE_PRECOMPRESSED config, these are sent to clients that
+    accept them instead of the original file. Brotli ".br" files are only
+    written if the "brotli" library is installed. Copies that are newer than
+    the original are kept. Copies that would not be smaller than the
+    original are not written.
+    """
+    app = current_app._get_current_object()
+    compressors: list[tuple[str, t.Callable[[bytes], bytes]]] = [
+        (".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))
+    ]
+
+    try:
+        import brotli
+    except ImportError:
+        click.secho(
+            " * Tip: Install 'brotli' to also write Brotli compressed files.",
+            fg="yellow",
+            err=True,
+        )
+    else:
+        compressors.insert(0, (".br", lambda data: brotli.compress(data, quality=11)))
+
+    suffixes = tuple(suffix for suffix, _ in compressors)
+    written = 0
+
+    for folder in _get_static_folders(app):
+        for dirpath, _, filenames in os.walk(folder):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+
+                if name.endswith(suffixes) or os.path.getsize(path) < min_size:
+                    continue
+
+                mtime = os.stat(path).st_mtime_ns
+                data: bytes | None = None
+
+                for suffix, compress in compressors:
+                    target = path + suffix
+
+                    try:
+                        if os.stat(target).st_mtime_ns >= mtime:
+                            continue
+                    except OSError:
+                        pass
+
+                    if data is None:
+                        with open(path, "rb") as f:
+                            data = f.read()
+
+                    value = compress(data)
+
+                    if len(value) >= len(data):
+                        # Don't leave an outdated copy to be sent.
+                        if os.path.exists(target):
+                            os.remove(target)
+
+                        continue
+
+                    with open(target, "wb") as f:
+                        f.write(value)
+
+                    written += 1
+
+    click.echo(f"Wrote {written} compressed files.")
+
+
+@static_cli.command("manifest", short_help="Write static file hashes.")
+def static_manifest_command() -> None:
+    """Write a manifest of the content hash of every file in each app and
+    blueprint static folder.
+
+    With the STATIC_HASHED_URLS config, url_for adds these hashes to static
+    file URLs, instead of hashing each file when a URL is first built for
+    it. Run this during a deploy, after the static files are final.
+    """
+    for folder in _get_static_folders(current_app._get_current_object()):
+        hashes = {}
+
+        for dirpath, _, filenames in os.walk(folder):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                filename = os.path.relpath(path, folder).replace(os.sep, "/")
+
+                if filename != StaticManifest.manifest_name:
+                    hashes[filename] = _hash_file(path)
+
+        with open(os.path.join(folder, StaticManifest.manifest_name), "w") as f:
+            json.dump(hashes, f, indent=2, sort_keys=True)
+
+        click.echo(f"Wrote {len(hashes)} hashes for {folder!r}.")
+
+
 cli = FlaskGroup(
     name="flask",
     help="""\
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import typing as t
+import zlib
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from .wrappers import Request
+    from .wrappers import Response
+
+#: The ``wbits`` value to pass to :func:`zlib.compressobj` for each
+#: supported content encoding, in order of preference.
+_encodings = {"gzip": 31, "deflate": 15}
+
+
+def _select_encoding(request: Request) -> str | None:
+    accept = request.accept_encodings
+    rv = None
+    quality = 0.0
+
+    for encoding in _encodings:
+        if (q := accept[encoding]) > quality:
+            rv = encoding
+            quality = q
+
+    return rv
+
+
+def _compress_stream(
+    chunks: t.Iterable[bytes], app_iter: t.Any, compressor: t.Any
+) -> t.Iterator[bytes]:
+    # Flush after each chunk, so the client gets each part of the stream
+    # as soon as it is produced, instead of when the buffer fills.
+    try:
+        for chunk in chunks:
+            if chunk:
+                yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+        yield compressor.flush()
+    finally:
+        if hasattr(app_iter, "close"):
+            app_iter.close()
+
+
+def compress_response(
+    request: Request,
+    response: Response,
+    *,
+    level: int = 6,
+    min_size: int = 500,
+    mimetypes: t.Collection[str] = (),
+) -> Response:
+    """Compress the body of a response with gzip or deflate, if the client
+    accepts it. This is called by :meth:`.Flask.process_response` if the
+    ``COMPRESS_RESPONSES`` config is enabled, using the other
+    ``COMPRESS_`` config.
+
+    Only responses with one of the given mimetypes are compressed. Buffered
+    responses smaller than ``min_size`` bytes are not compressed. Streamed
+    responses, such as from :func:`~flask.stream_template`, are compressed
+    as each chunk is produced. Responses that already have a
+    ``Content-Encoding``, are in ``direct_passthrough`` mode such as from
+    :func:`~flask.send_file`, or have ``Cache-Control: no-transform`` are
+    not changed. Partial responses, and responses with ``Accept-Ranges``,
+    are not changed either, since byte ranges refer to the uncompressed
+    body.
+
+    A strong ETag is made weak, since it describes the uncompressed body.
+
+    :param request: The request to check ``Accept-Encoding`` for.
+    :param response: The response to compress.
+    :param level: The compression level, from 1 (fastest) to 9 (smallest).
+    :param min_size: The minimum size of a buffered body to compress.
+    :param mimetypes: The mimetypes that can be compressed.
+
+    .. versionadded:: 3.2
+    """
+    if (
+        response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in mimetypes
+        or response.status_code < 200
+        or response.status_code in {204, 206, 304}
+        or "Content-Range" in response.headers
+        or "Accept-Ranges" in response.headers
+        or response.cache_control.no_transform
+    ):
+        return response
+
+    streamed = response.is_streamed
+    data = b"" if streamed else response.get_data()
+
+    if not streamed and len(data) < min_size:
+        return response
+
+    # The response depends on the header even if it isn't compressed.
+    response.vary.add("Accept-Encoding")
+
+    if (encoding := _select_encoding(request)) is None:
+        return response
+
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _encodings[encoding])
+
+    if streamed:
+        response.response = _compress_stream(
+            response.iter_encoded(), response.response, compressor
+        )
+        response.headers.pop("Content-Length", None)
+    else:
+        value = compressor.compress(data) + compressor.flush()
+
+        if len(value) >= len(data):
+            return response
+
+        response.set_data(value)
+
+    response.headers["Content-Encoding"] = encoding
+    etag, weak = response.get_etag()
+
+    if etag is not None and not weak:
+        response.set_etag(etag, weak=True)
+
+    return response
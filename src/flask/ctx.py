@@ -319,6 +319,8 @@ class AppContext:
         self._request: Request | None = request
         self._session: SessionMixin | None = session
         self._flashes: list[tuple[str, str]] | None = None
+        self._flash_data: t.Any = None
+        self._lazy_template_values: dict[t.Callable[[], t.Any], t.Any] = {}
         self._after_request_functions: list[ft.AfterRequestCallable[t.Any]] = []
 
         try:
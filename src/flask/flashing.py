@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import typing as t
+
+from .sessions import session_json_serializer
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from itsdangerous import URLSafeSerializer
+
+    from .ctx import AppContext
+    from .wrappers import Response
+
+
+class FlashInterface:
+    """The basic interface you have to implement in order to replace the
+    default flash message storage, which stores messages in the session.
+
+    :func:`~flask.flash` calls :meth:`add_flash` to store a message for a
+    later request, and :func:`~flask.get_flashed_messages` calls
+    :meth:`pop_flashes` to get and remove the stored messages.
+    :meth:`save_flashes` is called at the end of each request, before the
+    session is saved.
+
+    Set :attr:`flask.Flask.flash_interface` to an instance of a subclass to
+    replace the default.
+
+    .. versionadded:: 3.2
+    """
+
+    def add_flash(self, ctx: AppContext, category: str, message: str) -> None:
+        """Store a message to be shown by a later request."""
+        raise NotImplementedError()
+
+    def pop_flashes(self, ctx: AppContext) -> list[tuple[str, str]]:
+        """Get and remove all stored messages, as a list of
+        ``(category, message)`` tuples.
+        """
+        raise NotImplementedError()
+
+    def save_flashes(self, ctx: AppContext, response: Response) -> None:
+        """Persist any changes made during the request. Called for every
+        request, before the session is saved.
+        """
+
+
+class SessionFlashInterface(FlashInterface):
+    """The default flash interface, which stores messages in the ``_flashes``
+    key of the session. Flashing a message or getting messages modifies the
+    session, so the session cookie will be set again.
+    """
+
+    def add_flash(self, ctx: AppContext, category: str, message: str) -> None:
+        # Original implementation:
+        #
+        #     session.setdefault('_flashes', []).append((category, message))
+        #
+        # This assumed that changes made to mutable structures in the session
+        # are always in sync with the session object, which is not true for
+        # session implementations that use external storage for keeping their
+        # keys/values.
+        flashes = ctx.session.get("_flashes", [])
+        flashes.append((category, message))
+        ctx.session["_flashes"] = flashes
+
+    def pop_flashes(self, ctx: AppContext) -> list[tuple[str, str]]:
+        session = ctx.session
+        return session.pop("_flashes") if "_flashes" in session else []
+
+
+class CookieFlashInterface(FlashInterface):
+    """Store messages in a separate signed cookie instead of the session. This
+    avoids modifying the session, and setting the session cookie, when
+    flashing or showing messages. The cookie is only set when messages are
+    added, and is deleted once they are shown.
+
+    The cookie uses the same domain, path, and security settings as the
+    session cookie. A :attr:`~flask.Flask.secret_key` must be set.
+    """
+
+    #: The name of the cookie to store messages in.
+    cookie_name = "flashes"
+    #: The salt applied on top of the secret key when signing the cookie.
+    salt = "cookie-flashes"
+    #: The serializer for the messages, which supports :class:`~markupsafe.Markup`.
+    serializer = session_json_serializer
+
+    def get_signing_serializer(self, ctx: AppContext) -> URLSafeSerializer:
+        from itsdangerous import URLSafeSerializer
+
+        app = ctx.app
+
+        if not app.secret_key:
+            raise RuntimeError(
+                "Flashed messages are unavailable because no secret key was set."
+                " Set the secret_key on the application to something unique and"
+                " secret."
+            )
+
+        keys: list[str | bytes] = []
+
+        if fallbacks := app.config["SECRET_KEY_FALLBACKS"]:
+            keys.extend(fallbacks)
+
+        keys.append(app.secret_key)  # itsdangerous expects current key at top
+        return URLSafeSerializer(
+            keys,  # type: ignore[arg-type]
+            salt=self.salt,
+            serializer=self.serializer,
+        )
+
+    def _get_flashes(self, ctx: AppContext) -> list[tuple[str, str]]:
+        # The loaded and current messages are stored on the context, so that
+        # save_flashes can tell if the cookie needs to change.
+        if ctx._flash_data is None:
+            loaded: list[tuple[str, str]] = []
+            value = ctx.request.cookies.get(self.cookie_name)
+
+            if value:
+                from itsdangerous import BadSignature
+
+                try:
+                    loaded = self.get_signing_serializer(ctx).loads(value)
+                except BadSignature:
+                    pass
+
+            ctx._flash_data = (loaded, list(loaded))
+
+        return ctx._flash_data[1]  # type: ignore[no-any-return]
+
+    def add_flash(self, ctx: AppContext, category: str, message: str) -> None:
+        self._get_flashes(ctx).append((category, message))
+
+    def pop_flashes(self, ctx: AppContext) -> list[tuple[str, str]]:
+        flashes = self._get_flashes(ctx)
+        rv = flashes[:]
+        flashes.clear()
+        return rv
+
+    def save_flashes(self, ctx: AppContext, response: Response) -> None:
+        if ctx._flash_data is None:
+            return
+
+        # The response depends on the cookie if it was loaded at all.
+        response.vary.add("Cookie")
+        loaded, flashes = ctx._flash_data
+
+        if flashes == loaded:
+            return
+
+        app = ctx.app
+        si = app.session_interface
+        kwargs: dict[str, t.Any] = {
+            "domain": si.get_cookie_domain(app),
+            "path": si.get_cookie_path(app),
+            "secure": si.get_cookie_secure(app),
+            "partitioned": si.get_cookie_partitioned(app),
+            "samesite": si.get_cookie_samesite(app),
+            "httponly": si.get_cookie_httponly(app),
+        }
+
+        if flashes:
+            value = self.get_signing_serializer(ctx).dumps(flashes)
+            response.set_cookie(self.cookie_name, value, **kwargs)
+        else:
+            response.delete_cookie(self.cookie_name, **kwargs)
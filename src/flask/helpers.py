@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import copy
 import importlib.util
+import mimetypes
 import os
 import sys
+import threading
 import typing as t
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime
 from functools import cache
 from functools import update_wrapper
+from inspect import iscoroutinefunction
 
 import werkzeug.utils
 from werkzeug.exceptions import abort as _wz_abort
+from werkzeug.exceptions import NotFound
+from werkzeug.security import safe_join
 from werkzeug.utils import redirect as _wz_redirect
 from werkzeug.wrappers import Response as BaseResponse
 
@@ -17,12 +25,13 @@ from .globals import _cv_app
 from .globals import app_ctx
 from .globals import current_app
 from .globals import request
-from .globals import session
 from .signals import message_flashed
 
 if t.TYPE_CHECKING:  # pragma: no cover
     from .wrappers import Response
 
+F = t.TypeVar("F", bound=t.Callable[..., t.Any])
+
 
 def get_debug_flag() -> bool:
     """Get whether debug mode should be enabled for the app, indicated by the
@@ -135,6 +144,191 @@ def stream_with_context(
     return wrapped_g
 
 
+def _single_flight_key() -> t.Hashable:
+    if request.method in {"GET", "HEAD"}:
+        # Requests from different users may get different pages for the
+        # same URL, so only share between requests with the same credentials.
+        headers = request.headers
+        return (
+            request.method,
+            request.url,
+            headers.get("Cookie"),
+            headers.get("Authorization"),
+        )
+
+    return None
+
+
+def _copy_exception(e: BaseException) -> BaseException:
+    try:
+        return copy.copy(e)
+    except Exception:
+        # The exception can't be created again from its args.
+        return e
+
+
+def _buffer_response(rv: t.Any) -> tuple[bytes, int, list[tuple[str, str]]]:
+    response = current_app.make_response(rv)
+    # Read files and generators, the same body is sent for every request.
+    response.direct_passthrough = False
+
+    try:
+        body = response.get_data()
+    finally:
+        response.close()
+
+    return body, response.status_code, response.headers.to_wsgi_list()
+
+
+@t.overload
+def single_flight(f: F) -> F: ...
+
+
+@t.overload
+def single_flight(
+    *, key: t.Callable[[], t.Hashable] | None = None, timeout: float | None = 30
+) -> t.Callable[[F], F]: ...
+
+
+def single_flight(
+    f: F | None = None,
+    *,
+    key: t.Callable[[], t.Hashable] | None = None,
+    timeout: float | None = 30,
+) -> F | t.Callable[[F], F]:
+    """Decorate a view function so that identical requests that arrive while
+    it is already running wait for that call to finish and share its
+    response, instead of all running the view at the same time. This
+    prevents many workers from doing the same expensive work at once, such
+    as when a popular cached value expires.
+
+    .. code-block:: python
+
+        @app.route("/report")
+        @single_flight(timeout=10)
+        def report():
+            return render_template("report.html", data=build_report())
+
+    The response is read into memory, and each waiting request gets its own
+    copy of it, which is then processed normally. If the view raises an
+    exception, each waiting request raises a copy of it, with the original
+    exception as its ``__cause__``. Both ``def`` and ``async def`` views
+    are supported, with waiting requests in any thread.
+
+    A waiting request gets the response made for another request, so the
+    key must include everything the response depends on. By default,
+    ``GET`` and ``HEAD`` requests share a call if they have the same URL,
+    ``Cookie`` header, and ``Authorization`` header. If the view uses other
+    request data, such as another header or the client's address, pass a
+    ``key`` that includes it.
+
+    :param key: A function called with no arguments during the request that
+        returns a hashable key. Requests with the same key share a call. If
+        it returns ``None``, the request doesn't wait or share its response.
+    :param timeout: How long a request waits, in seconds. After that, it
+        calls the view itself. ``None`` waits forever.
+
+    .. versionadded:: 3.2
+    """
+    if f is None:
+        return lambda f: single_flight(f, key=key, timeout=timeout)
+
+    get_key = _single_flight_key if key is None else key
+    calls: dict[t.Hashable, Future[t.Any]] = {}
+    lock = threading.Lock()
+
+    def start() -> tuple[t.Hashable, Future[t.Any] | None]:
+        # Return the key and a new future if this request should call the
+        # view, or the future of the running call otherwise.
+        if (k := get_key()) is None:
+            return None, None
+
+        with lock:
+            if (future := calls.get(k)) is not None:
+                return None, future
+
+            calls[k] = future = Future()
+
+        future.set_running_or_notify_cancel()
+        return k, future
+
+    def finish(k: t.Hashable, future: Future[t.Any], value: t.Any) -> None:
+        with lock:
+            del calls[k]
+
+        # An exception is passed as the result, so that getting it doesn't
+        # raise it and add each waiting request's frames to its traceback.
+        future.set_result(value)
+
+    def make_shared_response(value: t.Any) -> Response:
+        if isinstance(value, BaseException):
+            # Each waiting request raises its own copy, without the
+            # original's traceback and context.
+            if (e := _copy_exception(value)) is value:
+                raise value
+
+            raise e from value
+
+        body, status, headers = value
+        return current_app.response_class(body, status, headers)
+
+    if iscoroutinefunction(f):
+
+        async def async_wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            import asyncio
+
+            k, future = start()
+
+            if future is None:
+                return await f(*args, **kwargs)
+
+            if k is None:
+                try:
+                    value = await asyncio.wait_for(
+                        asyncio.shield(asyncio.wrap_future(future)), timeout
+                    )
+                except asyncio.TimeoutError:
+                    return await f(*args, **kwargs)
+
+                return make_shared_response(value)
+
+            try:
+                value = _buffer_response(await f(*args, **kwargs))
+            except BaseException as e:
+                finish(k, future, e)
+                raise
+
+            finish(k, future, value)
+            return make_shared_response(value)
+
+        return update_wrapper(async_wrapper, f)  # type: ignore[return-value]
+
+    def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        k, future = start()
+
+        if future is None:
+            return f(*args, **kwargs)
+
+        if k is None:
+            try:
+                value = future.result(timeout)
+            except FutureTimeoutError:
+                return f(*args, **kwargs)
+
+            return make_shared_response(value)
+
+        try:
+            value = _buffer_response(f(*args, **kwargs))
+        except BaseException as e:
+            finish(k, future, e)
+            raise
+
+        finish(k, future, value)
+        return make_shared_response(value)
+
+    return update_wrapper(wrapper, f)  # type: ignore[return-value]
+
+
 def make_response(*args: t.Any) -> Response:
     """Sometimes it is necessary to set additional headers in a view.  Because
     views do not have to return response objects but can return a value that
@@ -285,6 +479,47 @@ def abort(code: int | BaseResponse, *args: t.Any, **kwargs: t.Any) -> t.NoReturn
     _wz_abort(code, *args, **kwargs)
 
 
+def check_etag(etag: str, weak: bool = False) -> None:
+    """Set the ETag for the response to the current request, and abort with
+    ``304 Not Modified`` if the request's ``If-None-Match`` header already
+    matches it. Call this at the start of a view, with a value that changes
+    whenever the response would, to skip rendering a response the client
+    already has.
+
+    .. code-block:: python
+
+        @app.route("/products/<int:id>")
+        def product(id):
+            product = get_product(id)
+            check_etag(f"{product.id}-{product.version}")
+            return render_template("product.html", product=product)
+
+    The ETag is only added to successful responses, and is used instead of
+    the one generated by the ``ETAG_RESPONSES`` config.
+
+    :param etag: The ETag value, without quotes.
+    :param weak: Set a weak ETag, for responses that are equivalent but
+        might not be identical byte for byte.
+
+    .. versionadded:: 3.2
+    """
+    ctx = app_ctx._get_current_object()
+
+    def set_etag(response: Response) -> Response:
+        if response.status_code == 200 and "ETag" not in response.headers:
+            response.set_etag(etag, weak=weak)
+
+        return response
+
+    ctx._after_request_functions.append(set_etag)
+    req = ctx.request
+
+    if req.method in {"GET", "HEAD"} and req.if_none_match.contains_weak(etag):
+        response = ctx.app.response_class(status=304)
+        response.set_etag(etag, weak=weak)
+        abort(response)
+
+
 def get_template_attribute(template_name: str, attribute: str) -> t.Any:
     """Loads a macro (or variable) a template exports.  This can be used to
     invoke a macro from within Python code.  If you for example have a
@@ -321,18 +556,13 @@ def flash(message: str, category: str = "message") -> None:
                      ``'error'`` for errors, ``'info'`` for information
                      messages and ``'warning'`` for warnings.  However any
                      kind of string can be used as category.
+
+    .. versionchanged:: 3.2
+        The message is stored by :attr:`.Flask.flash_interface`.
     """
-    # Original implementation:
-    #
-    #     session.setdefault('_flashes', []).append((category, message))
-    #
-    # This assumed that changes made to mutable structures in the session are
-    # always in sync with the session object, which is not true for session
-    # implementations that use external storage for keeping their keys/values.
-    flashes = session.get("_flashes", [])
-    flashes.append((category, message))
-    session["_flashes"] = flashes
-    app = current_app._get_current_object()
+    ctx = app_ctx._get_current_object()
+    ctx.app.flash_interface.add_flash(ctx, category, message)
+    app = ctx.app
     message_flashed.send(
         app,
         _async_wrapper=app.ensure_sync,
@@ -371,10 +601,14 @@ def get_flashed_messages(
     :param with_categories: set to ``True`` to also receive categories.
     :param category_filter: filter of categories to limit return values.  Only
                             categories in the list will be returned.
+
+    .. versionchanged:: 3.2
+        The messages are loaded by :attr:`.Flask.flash_interface`.
     """
     flashes = app_ctx._flashes
     if flashes is None:
-        flashes = session.pop("_flashes") if "_flashes" in session else []
+        ctx = app_ctx._get_current_object()
+        flashes = ctx.app.flash_interface.pop_flashes(ctx)
         app_ctx._flashes = flashes
     if category_filter:
         flashes = list(filter(lambda f: f[0] in category_filter, flashes))
@@ -448,6 +682,10 @@ def send_file(
         seconds. If set, ``Cache-Control`` will be ``public``, otherwise
         it will be ``no-cache`` to prefer conditional caching.
 
+    .. versionchanged:: 3.2
+        Sends large files from a memory mapping if
+        :attr:`.Flask.mapped_file_cache` is enabled.
+
     .. versionchanged:: 2.0
         ``download_name`` replaces the ``attachment_filename``
         parameter. If ``as_attachment=False``, it is passed with
@@ -509,7 +747,7 @@ def send_file(
 
     .. versionadded:: 0.2
     """
-    return werkzeug.utils.send_file(  # type: ignore[return-value]
+    return _send_file(
         **_prepare_send_file_kwargs(
             path_or_file=path_or_file,
             environ=request.environ,
@@ -554,6 +792,14 @@ def send_from_directory(
         ``directory``.
     :param kwargs: Arguments to pass to :func:`send_file`.
 
+    .. versionchanged:: 3.2
+        Sends a precompressed ``.br`` or ``.gz`` file next to the requested
+        file if the ``SEND_FILE_PRECOMPRESSED`` config is enabled.
+
+    .. versionchanged:: 3.2
+        Uses :attr:`.Flask.mapped_file_cache` and
+        :attr:`.Flask.send_file_path_cache` if they are enabled.
+
     .. versionchanged:: 2.0
         ``path`` replaces the ``filename`` parameter.
 
@@ -563,9 +809,98 @@ def send_from_directory(
 
     .. versionadded:: 0.5
     """
-    return werkzeug.utils.send_from_directory(  # type: ignore[return-value]
-        directory, path, **_prepare_send_file_kwargs(**kwargs)
-    )
+    kwargs = _prepare_send_file_kwargs(**kwargs)
+
+    if current_app.config["SEND_FILE_PRECOMPRESSED"] and not kwargs.get(
+        "as_attachment"
+    ):
+        return _send_precompressed(directory, os.fspath(path), kwargs)
+
+    return _send_from_directory(directory, path, kwargs)
+
+
+def _send_file(**kwargs: t.Any) -> Response:
+    """Send a file with :func:`werkzeug.utils.send_file`, or from a memory
+    mapping if the app's :attr:`~flask.Flask.mapped_file_cache` is enabled.
+    """
+    cache = current_app.mapped_file_cache
+
+    if cache is not None and (rv := cache.send_file(kwargs)) is not None:
+        return rv
+
+    return werkzeug.utils.send_file(**kwargs)  # type: ignore[return-value]
+
+
+def _send_from_directory(
+    directory: os.PathLike[str] | str,
+    path: os.PathLike[str] | str,
+    kwargs: dict[str, t.Any],
+) -> Response:
+    # The same as werkzeug.utils.send_from_directory, but calls _send_file.
+    if (cache := current_app.send_file_path_cache) is not None:
+        path_str = cache.resolve(directory, path, kwargs["_root_path"])
+
+        try:
+            return _send_file(path_or_file=path_str, **kwargs)
+        except FileNotFoundError:
+            # The file was removed while its path was remembered.
+            cache.invalidate(directory, path)
+            raise NotFound() from None
+
+    path_str = safe_join(os.fspath(directory), os.fspath(path))
+
+    if path_str is None:
+        raise NotFound()
+
+    path_str = os.path.join(kwargs["_root_path"], path_str)
+
+    if not os.path.isfile(path_str):
+        raise NotFound()
+
+    return _send_file(path_or_file=path_str, **kwargs)
+
+
+#: The file name suffix used for each precompressed content encoding, in
+#: order of preference.
+_precompressed_suffixes = {"br": ".br", "gzip": ".gz"}
+
+
+def _get_precompressed_suffixes() -> list[tuple[str, str]]:
+    """Get the ``(encoding, suffix)`` pairs of the precompressed variants
+    the client accepts, in order of preference.
+    """
+    accept = request.accept_encodings
+    rv = [(k, v) for k, v in _precompressed_suffixes.items() if accept[k]]
+    rv.sort(key=lambda item: accept[item[0]], reverse=True)
+    return rv
+
+
+def _send_precompressed(
+    directory: os.PathLike[str] | str, path: str, kwargs: dict[str, t.Any]
+) -> Response:
+    if kwargs.get("mimetype") is None:
+        kwargs["mimetype"] = mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+    if kwargs.get("download_name") is None:
+        kwargs["download_name"] = os.path.basename(path)
+
+    rv: Response | None = None
+
+    for encoding, suffix in _get_precompressed_suffixes():
+        try:
+            rv = _send_from_directory(directory, path + suffix, kwargs)
+        except NotFound:
+            continue
+
+        rv.headers["Content-Encoding"] = encoding
+        break
+
+    if rv is None:
+        rv = _send_from_directory(directory, path, kwargs)
+
+    # The response depends on the header even if no variant was sent.
+    rv.vary.add("Accept-Encoding")
+    return rv
 
 
 def get_root_path(import_name: str) -> str:
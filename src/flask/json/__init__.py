@@ -4,6 +4,7 @@ import json as _json
 import typing as t
 
 from ..globals import current_app
+from ..helpers import stream_with_context
 from .provider import _default
 
 if t.TYPE_CHECKING:  # pragma: no cover
@@ -168,3 +169,77 @@ def jsonify(*args: t.Any, **kwargs: t.Any) -> Response:
     .. versionadded:: 0.2
     """
     return current_app.json.response(*args, **kwargs)  # type: ignore[return-value]
+
+
+def stream_json(
+    items: t.Iterable[t.Any], *, lines: bool = False, buffer_size: int = 8192
+) -> Response:
+    """Serialize each item from an iterable as JSON while streaming the
+    response, rather than building the whole response in memory first.
+
+    By default, the items are written as a JSON array with the
+    ``application/json`` mimetype. If ``lines`` is enabled, they are
+    written as newline delimited JSON with the ``application/x-ndjson``
+    mimetype instead.
+
+    This requires an active request context. Each item is serialized
+    with :meth:`app.json.dumps_bytes()
+    <flask.json.provider.JSONProvider.dumps_bytes>`. The iterable is
+    consumed inside :func:`.stream_with_context`, so it can still access
+    :data:`.request` and other context data.
+
+    .. code-block:: python
+
+        @app.get("/export")
+        def export():
+            return stream_json(db.iter_records(), lines=True)
+
+    :param items: An iterable, such as a generator, of values to
+        serialize.
+    :param lines: Write newline delimited JSON instead of an array.
+    :param buffer_size: Collect serialized items until there are at least
+        this many bytes, then write them as one chunk. This results in
+        fewer, larger writes. Set to ``0`` to write each item as soon as
+        it is serialized.
+
+    .. versionadded:: 3.2
+    """
+    app = current_app._get_current_object()
+    dumps_bytes = app.json.dumps_bytes
+
+    if lines:
+        start, sep, end = b"", b"\n", b"\n"
+        mimetype = "application/x-ndjson"
+    else:
+        start, sep, end = b"[", b",", b"]\n"
+        mimetype = "application/json"
+
+    def generate() -> t.Iterator[bytes]:
+        buffer: list[bytes] = [start]
+        size = len(start)
+        first = True
+
+        for item in items:
+            if first:
+                first = False
+            else:
+                buffer.append(sep)
+                size += len(sep)
+
+            data = dumps_bytes(item)
+            buffer.append(data)
+            size += len(data)
+
+            if size >= buffer_size:
+                yield b"".join(buffer)
+                buffer.clear()
+                size = 0
+
+        # An empty NDJSON document has no lines.
+        if not (lines and first):
+            buffer.append(end)
+
+        if buffer:
+            yield b"".join(buffer)
+
+    return app.response_class(stream_with_context(generate()), mimetype=mimetype)
@@ -2,14 +2,20 @@ from __future__ import annotations
 
 import dataclasses
 import decimal
+import hashlib
 import json
+import threading
 import typing as t
 import uuid
 import weakref
+from collections import OrderedDict
 from datetime import date
+from functools import lru_cache
 
 from werkzeug.http import http_date
 
+from ..globals import request
+
 if t.TYPE_CHECKING:  # pragma: no cover
     from werkzeug.sansio.response import Response
 
@@ -35,8 +41,18 @@ class JSONProvider:
     .. versionadded:: 2.2
     """
 
+    #: The maximum number of keys :meth:`cached_response` stores bodies for.
+    #: When more are used, the least recently used body is removed.
+    #:
+    #: .. versionadded:: 3.2
+    cached_response_max_entries = 512
+
     def __init__(self, app: App) -> None:
         self._app: App = weakref.proxy(app)
+        self._response_cache: OrderedDict[
+            t.Hashable, tuple[t.Hashable, bytes, str | None, str]
+        ] = OrderedDict()
+        self._response_cache_lock = threading.Lock()
 
     def dumps(self, obj: t.Any, **kwargs: t.Any) -> str:
         """Serialize data as JSON.
@@ -46,6 +62,19 @@ class JSONProvider:
         """
         raise NotImplementedError
 
+    def dumps_bytes(self, obj: t.Any, **kwargs: t.Any) -> bytes:
+        """Serialize data as JSON to UTF-8 bytes. This is used by
+        :meth:`response`. The default implementation encodes the result
+        of :meth:`dumps`. Override this if the JSON library can produce
+        bytes directly, to avoid copying the data.
+
+        :param obj: The data to serialize.
+        :param kwargs: May be passed to the underlying JSON library.
+
+        .. versionadded:: 3.2
+        """
+        return self.dumps(obj, **kwargs).encode()
+
     def dump(self, obj: t.Any, fp: t.IO[str], **kwargs: t.Any) -> None:
         """Serialize data as JSON and write to a file.
 
@@ -100,9 +129,81 @@ class JSONProvider:
         :param args: A single value to serialize, or multiple values to
             treat as a list to serialize.
         :param kwargs: Treat as a dict to serialize.
+
+        .. versionchanged:: 3.2
+            Uses :meth:`dumps_bytes`.
         """
         obj = self._prepare_response_obj(args, kwargs)
-        return self._app.response_class(self.dumps(obj), mimetype="application/json")
+        return self._app.response_class(
+            self.dumps_bytes(obj), mimetype="application/json"
+        )
+
+    def cached_response(
+        self,
+        key: t.Hashable,
+        get_obj: t.Callable[[], t.Any],
+        version: t.Hashable = None,
+    ) -> Response:
+        """Return a JSON response for data that rarely changes, such as
+        reference data, without serializing it for every request.
+
+        The first time ``key`` is seen, or if ``version`` has changed since
+        the last call, ``get_obj`` is called and the result is passed to
+        :meth:`response`. The body is stored along with an ETag, and used
+        for later calls until ``version`` changes. The response supports
+        conditional requests, so a client that sends a matching
+        ``If-None-Match`` header gets a ``304 Not Modified`` response. At
+        most :attr:`cached_response_max_entries` keys are stored, so use a
+        fixed set of keys rather than one per request.
+
+        This requires an active request context.
+
+        .. code-block:: python
+
+            @app.get("/countries")
+            def countries():
+                return app.json.cached_response(
+                    "countries", load_countries, version=countries_updated_at()
+                )
+
+        :param key: Identifies the cached data.
+        :param get_obj: Called with no arguments to get the data to
+            serialize, when there is no cached body for the current version.
+        :param version: Any hashable value. If it is different than the
+            cached version, the data is serialized again.
+
+        .. versionadded:: 3.2
+        """
+        cache = self._response_cache
+
+        with self._response_cache_lock:
+            entry = cache.get(key)
+
+            if entry is not None:
+                cache.move_to_end(key)
+
+        if entry is None or entry[0] != version:
+            rv = self.response(get_obj())
+            data = rv.get_data()
+            etag = hashlib.sha256(data).hexdigest()
+            entry = (version, data, rv.mimetype, etag)
+
+            with self._response_cache_lock:
+                cache[key] = entry
+                cache.move_to_end(key)
+
+                while len(cache) > self.cached_response_max_entries:
+                    cache.popitem(last=False)
+
+        _, data, mimetype, etag = entry
+        rv = self._app.response_class(data, mimetype=mimetype)
+        rv.set_etag(etag)
+        return rv.make_conditional(request)
+
+
+@lru_cache(maxsize=512)
+def _dataclass_field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in dataclasses.fields(cls))
 
 
 def _default(o: t.Any) -> t.Any:
@@ -112,8 +213,10 @@ def _default(o: t.Any) -> t.Any:
     if isinstance(o, (decimal.Decimal, uuid.UUID)):
         return str(o)
 
-    if dataclasses and dataclasses.is_dataclass(o):
-        return dataclasses.asdict(o)  # type: ignore[arg-type]
+    if dataclasses and dataclasses.is_dataclass(o) and not isinstance(o, type):
+        # Shallow dict, nested values are passed back here by the encoder.
+        # Avoids dataclasses.asdict, which deep copies the values.
+        return {name: getattr(o, name) for name in _dataclass_field_names(type(o))}
 
     if hasattr(o, "__html__"):
         return str(o.__html__())
@@ -129,8 +232,9 @@ class DefaultJSONProvider(JSONProvider):
         serialized to :rfc:`822` strings. This is the same as the HTTP
         date format.
     -   :class:`uuid.UUID` is serialized to a string.
-    -   :class:`dataclasses.dataclass` is passed to
-        :func:`dataclasses.asdict`.
+    -   :class:`dataclasses.dataclass` is serialized to a dict of its
+        fields, the same as :func:`dataclasses.asdict` but without
+        copying the values.
     -   :class:`~markupsafe.Markup` (or any object with a ``__html__``
         method) will call the ``__html__`` method to get a string.
     """
@@ -201,6 +305,11 @@ class DefaultJSONProvider(JSONProvider):
         :param args: A single value to serialize, or multiple values to
             treat as a list to serialize.
         :param kwargs: Treat as a dict to serialize.
+
+        .. versionchanged:: 3.2
+            Uses :meth:`dumps_bytes`. The data and trailing newline are
+            passed to the response as separate chunks to avoid copying
+            the data again.
         """
         obj = self._prepare_response_obj(args, kwargs)
         dump_args: dict[str, t.Any] = {}
@@ -210,6 +319,7 @@ class DefaultJSONProvider(JSONProvider):
         else:
             dump_args.setdefault("separators", (",", ":"))
 
-        return self._app.response_class(
-            f"{self.dumps(obj, **dump_args)}\n", mimetype=self.mimetype
-        )
+        data = self.dumps_bytes(obj, **dump_args)
+        rv = self._app.response_class([data, b"\n"], mimetype=self.mimetype)
+        rv.content_length = len(data) + 1
+        return rv
@@ -28,6 +28,7 @@ be processed before ``dict``.
     class TagOrderedDict(JSONTag):
         __slots__ = ('serializer',)
         key = ' od'
+        types = (OrderedDict,)
 
         def check(self, value):
             return isinstance(value, OrderedDict)
@@ -66,10 +67,27 @@ class JSONTag:
     #: only used as an intermediate step during tagging.
     key: str = ""
 
+    #: The types this tag can apply to. The serializer only calls
+    #: :meth:`check` for values that are an instance of one of these
+    #: types. The default applies to all values.
+    #:
+    #: .. versionadded:: 3.2
+    types: tuple[type, ...] = (object,)
+
     def __init__(self, serializer: TaggedJSONSerializer) -> None:
         """Create a tagger for the given serializer."""
         self.serializer = serializer
 
+    def check_type(self, cls: type) -> bool:
+        """Check if values of the given type may be tagged by this tag. The
+        serializer caches the result for each type, and only calls
+        :meth:`check` for values whose type passed. By default, checks if the
+        type is a subclass of one of :attr:`types`.
+
+        .. versionadded:: 3.2
+        """
+        return issubclass(cls, self.types)
+
     def check(self, value: t.Any) -> bool:
         """Check if the given value should be tagged by this tag."""
         raise NotImplementedError
@@ -99,6 +117,7 @@ class TagDict(JSONTag):
 
     __slots__ = ()
     key = " di"
+    types = (dict,)
 
     def check(self, value: t.Any) -> bool:
         return (
@@ -118,6 +137,7 @@ class TagDict(JSONTag):
 
 class PassDict(JSONTag):
     __slots__ = ()
+    types = (dict,)
 
     def check(self, value: t.Any) -> bool:
         return isinstance(value, dict)
@@ -133,6 +153,7 @@ class PassDict(JSONTag):
 class TagTuple(JSONTag):
     __slots__ = ()
     key = " t"
+    types = (tuple,)
 
     def check(self, value: t.Any) -> bool:
         return isinstance(value, tuple)
@@ -146,6 +167,7 @@ class TagTuple(JSONTag):
 
 class PassList(JSONTag):
     __slots__ = ()
+    types = (list,)
 
     def check(self, value: t.Any) -> bool:
         return isinstance(value, list)
@@ -159,6 +181,7 @@ class PassList(JSONTag):
 class TagBytes(JSONTag):
     __slots__ = ()
     key = " b"
+    types = (bytes,)
 
     def check(self, value: t.Any) -> bool:
         return isinstance(value, bytes)
@@ -178,6 +201,9 @@ class TagMarkup(JSONTag):
     __slots__ = ()
     key = " m"
 
+    def check_type(self, cls: type) -> bool:
+        return callable(getattr(cls, "__html__", None))
+
     def check(self, value: t.Any) -> bool:
         return callable(getattr(value, "__html__", None))
 
@@ -191,6 +217,7 @@ class TagMarkup(JSONTag):
 class TagUUID(JSONTag):
     __slots__ = ()
     key = " u"
+    types = (UUID,)
 
     def check(self, value: t.Any) -> bool:
         return isinstance(value, UUID)
@@ -205,6 +232,7 @@ class TagUUID(JSONTag):
 class TagDateTime(JSONTag):
     __slots__ = ()
     key = " d"
+    types = (datetime,)
 
     def check(self, value: t.Any) -> bool:
         return isinstance(value, datetime)
@@ -231,7 +259,7 @@ class TaggedJSONSerializer:
     * :class:`~datetime.datetime`
     """
 
-    __slots__ = ("tags", "order")
+    __slots__ = ("tags", "order", "_dispatch", "_plain_types")
 
     #: Tag classes to bind when creating the serializer. Other tags can be
     #: added later using :meth:`~register`.
@@ -249,6 +277,8 @@ class TaggedJSONSerializer:
     def __init__(self) -> None:
         self.tags: dict[str, JSONTag] = {}
         self.order: list[JSONTag] = []
+        self._dispatch: dict[type, tuple[JSONTag, ...]] = {}
+        self._plain_types: frozenset[type] | None = None
 
         for cls in self.default_tags:
             self.register(cls)
@@ -286,9 +316,78 @@ class TaggedJSONSerializer:
         else:
             self.order.insert(index, tag)
 
+        self._dispatch.clear()
+        self._plain_types = None
+
+    def _tags_for_type(self, cls: type) -> tuple[JSONTag, ...]:
+        """Get the tags in order that may apply to values of the given type.
+        The result is cached until another tag is registered.
+        """
+        try:
+            return self._dispatch[cls]
+        except KeyError:
+            pass
+
+        tags = tuple(tag for tag in self.order if tag.check_type(cls))
+        self._dispatch[cls] = tags
+        return tags
+
+    def _get_plain_types(self) -> frozenset[type]:
+        """Get the JSON types that no registered tag will change. ``dict`` and
+        ``list`` are included if only the pass-through tags apply to them.
+        """
+        if self._plain_types is not None:
+            return self._plain_types
+
+        plain: set[type] = {
+            cls
+            for cls in (str, int, float, bool, type(None))
+            if not self._tags_for_type(cls)
+        }
+
+        if all(isinstance(tag, PassList) for tag in self._tags_for_type(list)):
+            plain.add(list)
+
+        if all(
+            isinstance(tag, (TagDict, PassDict)) for tag in self._tags_for_type(dict)
+        ):
+            plain.add(dict)
+
+        self._plain_types = rv = frozenset(plain)
+        return rv
+
+    def _is_plain(self, value: t.Any) -> bool:
+        """Check if the value is made of only JSON types that tagging would not
+        change, and that will not be untagged when loaded. Such a value can be
+        dumped and loaded without walking it again.
+        """
+        plain_types = self._get_plain_types()
+        stack = [value]
+
+        while stack:
+            value = stack.pop()
+            cls = type(value)
+
+            if cls not in plain_types:
+                return False
+
+            if cls is dict:
+                if len(value) == 1 and next(iter(value)) in self.tags:
+                    return False
+
+                stack.extend(value.values())
+            elif cls is list:
+                stack.extend(value)
+
+        return True
+
     def tag(self, value: t.Any) -> t.Any:
-        """Convert a value to a tagged representation if necessary."""
-        for tag in self.order:
+        """Convert a value to a tagged representation if necessary.
+
+        .. versionchanged:: 3.2
+            Only tags that apply to the value's type are checked.
+        """
+        for tag in self._tags_for_type(type(value)):
             if tag.check(value):
                 return tag.tag(value)
 
@@ -319,9 +418,25 @@ class TaggedJSONSerializer:
         return value
 
     def dumps(self, value: t.Any) -> str:
-        """Tag the value and dump it to a compact JSON string."""
-        return dumps(self.tag(value), separators=(",", ":"))
+        """Tag the value and dump it to a compact JSON string.
+
+        .. versionchanged:: 3.2
+            Values made of only plain JSON types are not tagged.
+        """
+        if not self._is_plain(value):
+            value = self.tag(value)
+
+        return dumps(value, separators=(",", ":"))
 
     def loads(self, value: str) -> t.Any:
-        """Load data from a JSON string and deserialized any tagged objects."""
-        return self._untag_scan(loads(value))
+        """Load data from a JSON string and deserialized any tagged objects.
+
+        .. versionchanged:: 3.2
+            Data without any tagged objects is not scanned again.
+        """
+        value = loads(value)
+
+        if self._is_plain(value):
+            return value
+
+        return self._untag_scan(value)
@@ -26,8 +26,6 @@ from ..helpers import get_debug_flag
 from ..json.provider import DefaultJSONProvider
 from ..json.provider import JSONProvider
 from ..logging import create_logger
-from ..templating import DispatchingJinjaLoader
-from ..templating import Environment
 from .scaffold import _endpoint_from_view_func
 from .scaffold import find_package
 from .scaffold import Scaffold
@@ -36,10 +34,22 @@ from .scaffold import setupmethod
 if t.TYPE_CHECKING:  # pragma: no cover
     from werkzeug.wrappers import Response as BaseResponse
 
+    from ..templating import DispatchingJinjaLoader
+    from ..templating import Environment
     from ..testing import FlaskClient
     from ..testing import FlaskCliRunner
     from .blueprints import Blueprint
 
+
+class _DefaultJinjaEnvironment:
+    # Import the default environment class when it is first accessed, so that
+    # importing Flask does not import Jinja.
+    def __get__(self, obj: t.Any, owner: t.Any) -> type[Environment]:
+        from ..templating import Environment
+
+        return Environment
+
+
 T_shell_context_processor = t.TypeVar(
     "T_shell_context_processor", bound=ft.ShellContextProcessorCallable
 )
@@ -166,7 +176,7 @@ class App(Scaffold):
     #: The class that is used for the Jinja environment.
     #:
     #: .. versionadded:: 0.11
-    jinja_environment = Environment
+    jinja_environment: type[Environment] = _DefaultJinjaEnvironment()  # type: ignore[assignment]
 
     #: The class that is used for the :data:`~flask.g` instance.
     #:
@@ -473,6 +483,18 @@ class App(Scaffold):
         """
         return self.create_jinja_environment()
 
+    @cached_property
+    def jinja_env_async(self) -> Environment:
+        """A copy of :attr:`jinja_env` with async rendering enabled, used by
+        :func:`~flask.render_template_async`. It shares the loader, globals,
+        filters, and tests of :attr:`jinja_env`. It is created the first time
+        it is accessed, so set other attributes on :attr:`jinja_env` before
+        then.
+
+        .. versionadded:: 3.2
+        """
+        return self.jinja_env.overlay(enable_async=True)  # type: ignore[return-value]
+
     def create_jinja_environment(self) -> Environment:
         raise NotImplementedError()
 
@@ -528,6 +550,8 @@ class App(Scaffold):
 
         .. versionadded:: 0.7
         """
+        from ..templating import DispatchingJinjaLoader
+
         return DispatchingJinjaLoader(self)
 
     def select_jinja_autoescape(self, filename: str) -> bool:
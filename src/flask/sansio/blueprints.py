@@ -336,7 +336,9 @@ class Blueprint(Scaffold):
 
         cli_resolved_group = options.get("cli_group", self.cli_group)
 
-        if self.cli.commands:
+        # The group may be created on first access, don't create it only to
+        # find that it has no commands.
+        if "cli" in vars(self) and self.cli.commands:
             if cli_resolved_group is None:
                 app.cli.commands.update(self.cli.commands)
             elif cli_resolved_group is _sentinel:
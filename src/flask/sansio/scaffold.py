@@ -8,18 +8,16 @@ import typing as t
 from collections import defaultdict
 from functools import update_wrapper
 
-from jinja2 import BaseLoader
-from jinja2 import FileSystemLoader
 from werkzeug.exceptions import default_exceptions
 from werkzeug.exceptions import HTTPException
 from werkzeug.utils import cached_property
 
 from .. import typing as ft
 from ..helpers import get_root_path
-from ..templating import _default_template_ctx_processor
 
 if t.TYPE_CHECKING:  # pragma: no cover
     from click import Group
+    from jinja2 import BaseLoader
 
 # a singleton sentinel value for parameter defaults
 _sentinel = object()
@@ -49,6 +47,14 @@ def setupmethod(f: F) -> F:
     return t.cast(F, update_wrapper(wrapper_func, f))
 
 
+def _default_template_ctx_processor() -> dict[str, t.Any]:
+    # Don't import the templating module, and Jinja, until a template is
+    # rendered.
+    from ..templating import _default_template_ctx_processor
+
+    return _default_template_ctx_processor()
+
+
 class Scaffold:
     """Common behavior shared between :class:`~flask.Flask` and
     :class:`~flask.blueprints.Blueprint`.
@@ -277,6 +283,8 @@ class Scaffold:
         .. versionadded:: 0.5
         """
         if self.template_folder is not None:
+            from jinja2 import FileSystemLoader
+
             return FileSystemLoader(os.path.join(self.root_path, self.template_folder))
         else:
             return None
@@ -3,18 +3,19 @@ from __future__ import annotations
 import collections.abc as c
 import hashlib
 import typing as t
+import zlib
 from collections.abc import MutableMapping
 from datetime import datetime
 from datetime import timezone
+from functools import cache
 
-from itsdangerous import BadSignature
-from itsdangerous import URLSafeTimedSerializer
 from werkzeug.datastructures import CallbackDict
 
 from .json.tag import TaggedJSONSerializer
 
 if t.TYPE_CHECKING:  # pragma: no cover
     import typing_extensions as te
+    from itsdangerous import URLSafeTimedSerializer
 
     from .app import Flask
     from .wrappers import Request
@@ -295,6 +296,40 @@ def _lazy_sha1(string: bytes = b"") -> t.Any:
     return hashlib.sha1(string)
 
 
+@cache
+def _get_signing_serializer_class() -> type[URLSafeTimedSerializer]:
+    # Define the class when it is first used, so that importing Flask does
+    # not import itsdangerous.
+    from itsdangerous import URLSafeTimedSerializer
+    from itsdangerous.encoding import base64_encode
+    from itsdangerous.url_safe import URLSafeSerializerMixin
+
+    class _SessionSigningSerializer(URLSafeTimedSerializer):
+        """Only try to compress the payload if it is at least
+        ``compress_threshold`` bytes. The output can be loaded by any
+        :class:`~itsdangerous.url_safe.URLSafeTimedSerializer`.
+        """
+
+        compress_threshold: int = 0
+
+        def dump_payload(self, obj: t.Any) -> bytes:
+            if not self.compress_threshold:
+                return super().dump_payload(obj)
+
+            # Skip the mixin, which always tries to compress.
+            json = super(URLSafeSerializerMixin, self).dump_payload(obj)
+
+            if len(json) >= self.compress_threshold:
+                compressed = zlib.compress(json)
+
+                if len(compressed) < (len(json) - 1):
+                    return b"." + base64_encode(compressed)
+
+            return base64_encode(json)
+
+    return _SessionSigningSerializer
+
+
 class SecureCookieSessionInterface(SessionInterface):
     """The default session interface that stores sessions in signed cookies
     through the :mod:`itsdangerous` module.
@@ -313,8 +348,26 @@ class SecureCookieSessionInterface(SessionInterface):
     #: such as datetime objects or tuples.
     serializer = session_json_serializer
     session_class = SecureCookieSession
+    #: Only try to compress serialized session data that is at least this many
+    #: bytes. Compressing small payloads rarely makes them shorter, so this
+    #: saves work on each save. If ``None``, compression is always tried.
+    #:
+    #: .. versionadded:: 3.2
+    compress_threshold: int | None = None
+    #: If the signed cookie value is longer than this, :meth:`session_too_large`
+    #: is called instead of setting the cookie. If ``None``, the size is not
+    #: checked here, Werkzeug will still warn based on :data:`MAX_COOKIE_SIZE`.
+    #:
+    #: .. versionadded:: 3.2
+    max_cookie_value_size: int | None = None
 
     def get_signing_serializer(self, app: Flask) -> URLSafeTimedSerializer | None:
+        """Create the :mod:`itsdangerous` serializer used to sign and load the
+        session cookie. Returns ``None`` if no secret key is set.
+
+        .. versionchanged:: 3.2
+            Uses :attr:`compress_threshold`.
+        """
         if not app.secret_key:
             return None
 
@@ -324,7 +377,7 @@ class SecureCookieSessionInterface(SessionInterface):
             keys.extend(fallbacks)
 
         keys.append(app.secret_key)  # itsdangerous expects current key at top
-        return URLSafeTimedSerializer(
+        s = _get_signing_serializer_class()(
             keys,  # type: ignore[arg-type]
             salt=self.salt,
             serializer=self.serializer,
@@ -334,6 +387,30 @@ class SecureCookieSessionInterface(SessionInterface):
             },
         )
 
+        if self.compress_threshold is not None:
+            s.compress_threshold = self.compress_threshold  # type: ignore[attr-defined]
+
+        return s
+
+    def session_too_large(
+        self, app: Flask, session: SessionMixin, value: str
+    ) -> str | None:
+        """Called by :meth:`save_session` if the signed cookie value is longer
+        than :attr:`max_cookie_value_size`. Return the value to set instead,
+        or ``None`` to delete the cookie, so the client doesn't keep sending
+        an outdated session. Override this to move data out of the cookie,
+        for example into server side storage.
+
+        The default implementation raises a :exc:`RuntimeError`.
+
+        .. versionadded:: 3.2
+        """
+        raise RuntimeError(
+            f"The session cookie is {len(value)} bytes, larger than the"
+            f" {self.max_cookie_value_size} bytes allowed by"
+            " 'max_cookie_value_size'. Store less data in the session."
+        )
+
     def open_session(self, app: Flask, request: Request) -> SecureCookieSession | None:
         s = self.get_signing_serializer(app)
         if s is None:
@@ -341,6 +418,8 @@ class SecureCookieSessionInterface(SessionInterface):
         val = request.cookies.get(self.get_cookie_name(app))
         if not val:
             return self.session_class()
+        from itsdangerous import BadSignature
+
         max_age = int(app.permanent_session_lifetime.total_seconds())
         try:
             data = s.loads(val, max_age=max_age)
@@ -385,6 +464,28 @@ class SecureCookieSessionInterface(SessionInterface):
 
         expires = self.get_expiration_time(app, session)
         val = self.get_signing_serializer(app).dumps(dict(session))  # type: ignore[union-attr]
+
+        if (
+            self.max_cookie_value_size is not None
+            and len(val) > self.max_cookie_value_size
+        ):
+            replaced = self.session_too_large(app, session, val)
+
+            if replaced is None:
+                response.delete_cookie(
+                    name,
+                    domain=domain,
+                    path=path,
+                    secure=secure,
+                    partitioned=partitioned,
+                    samesite=samesite,
+                    httponly=httponly,
+                )
+                response.vary.add("Cookie")
+                return
+
+            val = replaced
+
         response.set_cookie(
             name,
             val,
@@ -0,0 +1,606 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import mimetypes
+import mmap
+import os
+import posixpath
+import re
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+from zlib import adler32
+
+import werkzeug.utils
+from werkzeug.exceptions import NotFound
+from werkzeug.security import safe_join
+
+from .globals import app_ctx
+from .globals import current_app
+from .helpers import _get_precompressed_suffixes
+from .helpers import send_from_directory
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from .wrappers import Response
+
+
+class _StaticFile:
+    __slots__ = ("mtime_ns", "mtime", "data", "etag", "mimetype", "encoding")
+
+    def __init__(self, path: str, stat: os.stat_result, data: bytes) -> None:
+        self.mtime_ns = stat.st_mtime_ns
+        self.mtime = stat.st_mtime
+        self.data = data
+        # The same ETag that send_file generates, so it doesn't change when
+        # a file is added to or evicted from the cache.
+        check = adler32(path.encode()) & 0xFFFFFFFF
+        self.etag = f"{stat.st_mtime}-{stat.st_size}-{check}"
+        self.mimetype, self.encoding = mimetypes.guess_type(path)
+
+        if self.mimetype is None:
+            self.mimetype = "application/octet-stream"
+
+
+class StaticFileCache:
+    """Keep small static files in memory to serve them without opening and
+    reading the file each time. The ETag, last modified time, mimetype, and
+    length of each file are computed once when it is loaded. Conditional and
+    range requests are served from the data in memory.
+
+    Each file is still checked with :func:`os.stat` when it is requested,
+    and is loaded again if its modification time or size changed. When the
+    total size of the files is over ``max_size``, the least recently used
+    files are removed.
+
+    This is used by :meth:`.Flask.send_static_file` for the app and
+    blueprint static folders if the ``STATIC_FILE_CACHE_SIZE`` config is
+    set. It is available as :attr:`.Flask.static_file_cache`.
+
+    :param max_size: The maximum total size in bytes of the stored files.
+    :param max_file_size: Files larger than this many bytes are not stored,
+        and are sent with :func:`~flask.send_from_directory` instead.
+
+    .. versionadded:: 3.2
+    """
+
+    def __init__(self, max_size: int, max_file_size: int = 1_048_576) -> None:
+        self.max_size = max_size
+        self.max_file_size = min(max_file_size, max_size)
+        self._files: OrderedDict[str, _StaticFile] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _get(self, path: str) -> _StaticFile | None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        with self._lock:
+            file = self._files.get(path)
+
+            if (
+                file is not None
+                and file.mtime_ns == stat.st_mtime_ns
+                and len(file.data) == stat.st_size
+            ):
+                self._files.move_to_end(path)
+                return file
+
+        if not os.path.isfile(path) or stat.st_size > self.max_file_size:
+            return None
+
+        with open(path, "rb") as f:
+            data = f.read()
+
+        file = _StaticFile(path, stat, data)
+
+        with self._lock:
+            if (old := self._files.pop(path, None)) is not None:
+                self._size -= len(old.data)
+
+            self._files[path] = file
+            self._size += len(data)
+
+            while self._size > self.max_size:
+                _, old = self._files.popitem(last=False)
+                self._size -= len(old.data)
+
+        return file
+
+    def send(
+        self, directory: str, filename: str, max_age: int | None = None
+    ) -> Response | None:
+        """Send a file from a directory using the data in memory. Returns
+        ``None`` if the file should be sent with
+        :func:`~flask.send_from_directory` instead, such as if it does not
+        exist, is too large to store, or ``USE_X_SENDFILE`` is enabled.
+
+        If the ``SEND_FILE_PRECOMPRESSED`` config is enabled, a stored
+        ``.br`` or ``.gz`` variant is sent like ``send_from_directory``
+        does.
+
+        :param directory: The directory to look for the file in.
+        :param filename: The path to the file, relative to ``directory``.
+        :param max_age: The cache control max age to send, in seconds.
+        """
+        ctx = app_ctx._get_current_object()
+        app = ctx.app
+
+        if app.config["USE_X_SENDFILE"]:
+            return None
+
+        path = safe_join(os.path.join(app.root_path, directory), filename)
+
+        if path is None:
+            return None
+
+        file = None
+        precompressed = app.config["SEND_FILE_PRECOMPRESSED"]
+
+        # The mimetype and content encoding of a variant are guessed from its
+        # name, such as "app.js.br".
+        if precompressed:
+            for _, suffix in _get_precompressed_suffixes():
+                if (file := self._get(path + suffix)) is not None:
+                    break
+
+        if file is None and (file := self._get(path)) is None:
+            return None
+
+        rv = app.response_class(file.data, mimetype=file.mimetype)
+
+        if precompressed:
+            rv.vary.add("Accept-Encoding")
+
+        if file.encoding is not None:
+            rv.headers["Content-Encoding"] = file.encoding
+
+        rv.last_modified = file.mtime  # type: ignore[assignment]
+        rv.cache_control.no_cache = True
+
+        if max_age is not None:
+            if max_age > 0:
+                rv.cache_control.no_cache = None
+                rv.cache_control.public = True
+
+            rv.cache_control.max_age = max_age
+            rv.expires = int(time.time() + max_age)  # type: ignore[assignment]
+
+        rv.set_etag(file.etag)
+        return rv.make_conditional(
+            ctx.request.environ, accept_ranges=True, complete_length=len(file.data)
+        )
+
+    def clear(self) -> None:
+        """Remove all stored files."""
+        with self._lock:
+            self._files.clear()
+            self._size = 0
+
+
+class _MappedFileReader:
+    """A file-like reader for a shared memory mapping, with its own
+    position so that concurrent responses can read the same mapping.
+    """
+
+    def __init__(self, mapping: mmap.mmap) -> None:
+        self._mapping = mapping
+        self._pos = 0
+
+    def read(self, size: int = -1) -> bytes:
+        start = self._pos
+        end = len(self._mapping) if size < 0 else min(start + size, len(self._mapping))
+        self._pos = max(start, end)
+        return self._mapping[start:end]
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._pos
+        elif whence == os.SEEK_END:
+            offset += len(self._mapping)
+
+        self._pos = max(offset, 0)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        # The mapping is shared, and is owned by the cache.
+        pass
+
+
+class MappedFileCache:
+    """Send range requests for large files, such as seeking in a video, from
+    a memory mapping that is shared between requests, instead of opening
+    the file and seeking for each request. Reading data that is already in
+    the operating system's page cache doesn't need any system calls.
+
+    Requests without a ``Range`` header are sent normally, so that the
+    server can send the whole file with ``wsgi.file_wrapper``, which may
+    use :func:`os.sendfile`. Files smaller than ``min_size`` are also sent
+    normally. When more than
+    ``max_entries`` files are mapped, the least recently used mapping is
+    removed. Each file is checked with :func:`os.stat` when it is sent, and
+    is mapped again if its modification time or size changed. A removed
+    mapping is closed once no response is still reading from it.
+
+    Only use this for files that are replaced, such as with
+    :func:`os.replace`, rather than modified in place. Reading a mapping of
+    a file that was truncated crashes the process.
+
+    This is used by :func:`~flask.send_file` and
+    :func:`~flask.send_from_directory` if the ``SEND_FILE_MMAP_CACHE_SIZE``
+    config is set. It is available as :attr:`.Flask.mapped_file_cache`.
+
+    :param max_entries: The maximum number of files to keep mapped.
+    :param min_size: Files smaller than this many bytes are not mapped.
+
+    .. versionadded:: 3.2
+    """
+
+    def __init__(self, max_entries: int = 16, min_size: int = 1_048_576) -> None:
+        self.max_entries = max_entries
+        self.min_size = max(min_size, 1)
+        self._mappings: OrderedDict[str, tuple[int, int, mmap.mmap]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, path: str, stat: os.stat_result) -> mmap.mmap:
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            if (entry := self._mappings.get(path)) is not None and entry[:2] == key:
+                self._mappings.move_to_end(path)
+                return entry[2]
+
+        with open(path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        with self._lock:
+            # Responses may still be reading from a removed mapping. It is
+            # closed when it is garbage collected instead of here.
+            self._mappings[path] = (*key, mapping)
+            self._mappings.move_to_end(path)
+
+            while len(self._mappings) > self.max_entries:
+                self._mappings.popitem(last=False)
+
+        return mapping
+
+    def send_file(self, kwargs: dict[str, t.Any]) -> Response | None:
+        """Send a range of a file from a memory mapping. Returns ``None`` if
+        the file should be sent with :func:`werkzeug.utils.send_file`
+        instead, such as if the request isn't a range request, a file object
+        was given, the file is smaller than ``min_size``, or
+        ``USE_X_SENDFILE`` is enabled.
+
+        :param kwargs: The arguments to :func:`werkzeug.utils.send_file`.
+        """
+        path_or_file = kwargs["path_or_file"]
+
+        if (
+            "HTTP_RANGE" not in kwargs["environ"]
+            or kwargs.get("use_x_sendfile")
+            or not isinstance(path_or_file, (str, os.PathLike))
+        ):
+            return None
+
+        path = os.path.join(kwargs.get("_root_path") or "", path_or_file)
+        stat = os.stat(path)
+
+        if stat.st_size < self.min_size or not os.path.isfile(path):
+            return None
+
+        kwargs = kwargs.copy()
+        kwargs["path_or_file"] = _MappedFileReader(self._get(path, stat))
+        conditional = kwargs.pop("conditional", True)
+
+        # Werkzeug only detects these from a path, not a file object.
+        if kwargs.get("download_name") is None:
+            kwargs["download_name"] = os.path.basename(path)
+
+        if kwargs.get("last_modified") is None:
+            kwargs["last_modified"] = stat.st_mtime
+
+        if kwargs.get("etag", True) is True:
+            check = adler32(path.encode()) & 0xFFFFFFFF
+            kwargs["etag"] = f"{stat.st_mtime}-{stat.st_size}-{check}"
+
+        if callable(max_age := kwargs.get("max_age")):
+            kwargs["max_age"] = max_age(path)
+
+        rv: Response = werkzeug.utils.send_file(  # type: ignore[assignment]
+            **kwargs, conditional=False
+        )
+        rv.content_length = stat.st_size
+
+        if conditional:
+            rv = rv.make_conditional(
+                kwargs["environ"], accept_ranges=True, complete_length=stat.st_size
+            )
+
+        return rv
+
+
+class FilePathCache:
+    """Remember how :func:`~flask.send_from_directory` resolved a path for a
+    short time, to avoid calling :func:`~werkzeug.security.safe_join` and
+    checking that the file exists on every request. This is useful if the
+    directory is on a slow network filesystem. Sending the file still opens
+    it and calls :func:`os.stat`, so this saves one of the two metadata
+    lookups for each request. If the file was removed, the path is
+    forgotten and a 404 error is raised.
+
+    A path that was found is remembered for ``ttl`` seconds. A path that
+    was not found, and resulted in a 404 error, is remembered for
+    ``not_found_ttl`` seconds, which should be shorter. When more than
+    ``max_entries`` paths are remembered, the least recently used are
+    removed.
+
+    Call :meth:`invalidate` after writing or removing a file in the
+    directory, so it is found or not found immediately.
+
+    .. code-block:: python
+
+        path_cache = app.send_file_path_cache
+
+        if path_cache is not None:
+            path_cache.invalidate(app.config["UPLOAD_FOLDER"], name)
+
+    This is used by :func:`~flask.send_from_directory` if the
+    ``SEND_FILE_PATH_CACHE_TTL`` config is set. It is available as
+    :attr:`.Flask.send_file_path_cache`.
+
+    :param ttl: Seconds to remember a path that was found.
+    :param not_found_ttl: Seconds to remember a path that was not found.
+    :param max_entries: The maximum number of paths to remember.
+
+    .. versionadded:: 3.2
+    """
+
+    def __init__(
+        self, ttl: float, not_found_ttl: float = 1, max_entries: int = 4096
+    ) -> None:
+        self.ttl = ttl
+        self.not_found_ttl = not_found_ttl
+        self.max_entries = max_entries
+        self._paths: OrderedDict[tuple[str, str], tuple[float, str | None]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def resolve(
+        self,
+        directory: os.PathLike[str] | str,
+        path: os.PathLike[str] | str,
+        root_path: str,
+    ) -> str:
+        """Get the full path to a file in a directory. Raises a 404
+        :exc:`~werkzeug.exceptions.NotFound` error if the path is outside
+        the directory or the file does not exist.
+
+        :param directory: The directory that ``path`` must be located under,
+            relative to ``root_path``.
+        :param path: The path to the file, relative to ``directory``.
+        :param root_path: The app's root path.
+        """
+        key = (os.fspath(directory), os.fspath(path))
+        now = time.monotonic()
+
+        with self._lock:
+            if (entry := self._paths.get(key)) is not None and entry[0] > now:
+                self._paths.move_to_end(key)
+                rv = entry[1]
+
+                if rv is None:
+                    raise NotFound()
+
+                return rv
+
+        rv = safe_join(*key)
+
+        if rv is not None:
+            rv = os.path.join(root_path, rv)
+
+            if not os.path.isfile(rv):
+                rv = None
+
+        expires = now + (self.ttl if rv is not None else self.not_found_ttl)
+
+        with self._lock:
+            self._paths[key] = (expires, rv)
+            self._paths.move_to_end(key)
+
+            while len(self._paths) > self.max_entries:
+                self._paths.popitem(last=False)
+
+        if rv is None:
+            raise NotFound()
+
+        return rv
+
+    def invalidate(
+        self, directory: os.PathLike[str] | str, path: os.PathLike[str] | str
+    ) -> None:
+        """Forget how a path was resolved, so that it is checked again the
+        next time it is sent.
+
+        :param directory: The directory passed to ``send_from_directory``.
+        :param path: The path passed to ``send_from_directory``.
+        """
+        with self._lock:
+            self._paths.pop((os.fspath(directory), os.fspath(path)), None)
+
+    def clear(self) -> None:
+        """Forget all resolved paths."""
+        with self._lock:
+            self._paths.clear()
+
+
+_hashed_name_re = re.compile(r"(?P<base>.+)\.(?P<hash>[0-9a-f]{12})(?P<ext>\.[^./]*)?")
+
+
+def _hash_file(path: str) -> str:
+    h = hashlib.sha256()
+
+    with open(path, "rb") as f:
+        while chunk := f.read(65536):
+            h.update(chunk)
+
+    return h.hexdigest()[:12]
+
+
+class StaticManifest:
+    """Add a hash of each static file's content to its URL, such as
+    ``app.3f2a1b9c0d4e.css`` for ``app.css``. The URL changes when the
+    content does, so the file can be cached by browsers forever instead of
+    being revalidated.
+
+    :func:`~flask.url_for` uses :meth:`get_url_filename` for the
+    ``static`` endpoint of the app and blueprints.
+    :meth:`.Flask.send_static_file` uses :meth:`resolve` to find the
+    original file, and sends it with a :attr:`max_age` of a year and the
+    ``immutable`` cache control. A URL with a hash that doesn't match the
+    file's current content, such as from a page rendered before a deploy,
+    is served the current content with the normal cache settings.
+
+    The hashes are read from a :attr:`manifest_name` file in each static
+    folder, written by the ``flask static manifest`` command during a
+    deploy. Files not in the manifest are hashed the first time a URL is
+    built for them, and again if their modification time or size changes.
+
+    This is used if the ``STATIC_HASHED_URLS`` config is enabled. It is
+    available as :attr:`.Flask.static_manifest`.
+
+    .. versionadded:: 3.2
+    """
+
+    #: The name of the manifest file in each static folder.
+    manifest_name = "static-manifest.json"
+
+    #: The cache control max age to send for hashed URLs.
+    max_age = 31_536_000
+
+    def __init__(self) -> None:
+        self._manifests: dict[str, dict[str, str]] = {}
+        self._hashes: dict[str, tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def _get_manifest(self, folder: str) -> dict[str, str]:
+        try:
+            return self._manifests[folder]
+        except KeyError:
+            pass
+
+        try:
+            with open(os.path.join(folder, self.manifest_name), "rb") as f:
+                rv = json.load(f)
+        except FileNotFoundError:
+            rv = {}
+
+        self._manifests[folder] = rv
+        return rv  # type: ignore[no-any-return]
+
+    def get_hash(self, folder: str, filename: str) -> str | None:
+        """Get the hash of a file in a static folder, or ``None`` if the
+        file doesn't exist.
+
+        :param folder: The static folder.
+        :param filename: The path to the file, relative to ``folder``.
+        """
+        if (rv := self._get_manifest(folder).get(filename)) is not None:
+            return rv
+
+        path = safe_join(folder, filename)
+
+        if path is None:
+            return None
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        with self._lock:
+            cached = self._hashes.get(path)
+
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        if not os.path.isfile(path):
+            return None
+
+        rv = _hash_file(path)
+
+        with self._lock:
+            self._hashes[path] = (stat.st_mtime_ns, stat.st_size, rv)
+
+        return rv
+
+    def get_url_filename(self, folder: str, filename: str) -> str:
+        """Get the name with the content hash to use in a URL for a file in
+        a static folder. The name is returned unchanged if the file doesn't
+        exist.
+
+        :param folder: The static folder.
+        :param filename: The path to the file, relative to ``folder``.
+        """
+        if (file_hash := self.get_hash(folder, filename)) is None:
+            return filename
+
+        base, ext = posixpath.splitext(filename)
+        return f"{base}.{file_hash}{ext}"
+
+    def resolve(self, folder: str, filename: str) -> tuple[str, bool]:
+        """Get the original name of a file from a name with a content hash.
+        Returns the original name, and whether the hash matches the file's
+        current content. If the name doesn't have a hash, or the original
+        file doesn't exist, the name is returned unchanged with ``False``.
+
+        :param folder: The static folder.
+        :param filename: The name from the URL, relative to ``folder``.
+        """
+        if (m := _hashed_name_re.fullmatch(filename)) is None:
+            return filename, False
+
+        original = m["base"] + (m["ext"] or "")
+
+        if (file_hash := self.get_hash(folder, original)) is None:
+            return filename, False
+
+        return original, file_hash == m["hash"]
+
+
+def _send_static_file(folder: str, filename: str, max_age: int | None) -> Response:
+    """Send a file from a static folder, using the app's static manifest
+    and static file cache if they are enabled. Called by the app's and
+    blueprints' ``send_static_file``.
+    """
+    app = current_app
+    manifest = app.static_manifest
+    immutable = False
+
+    if manifest is not None:
+        filename, immutable = manifest.resolve(folder, os.fspath(filename))
+
+        if immutable:
+            max_age = manifest.max_age
+
+    rv: Response | None = None
+
+    if (cache := app.static_file_cache) is not None:
+        rv = cache.send(folder, filename, max_age)
+
+    if rv is None:
+        rv = send_from_directory(folder, filename, max_age=max_age)
+
+    if immutable:
+        rv.cache_control.immutable = True
+
+    return rv
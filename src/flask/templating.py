@@ -1,43 +1,244 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
+import os
+import threading
 import typing as t
 
 from jinja2 import BaseLoader
 from jinja2 import Environment as BaseEnvironment
+from jinja2 import nodes
 from jinja2 import Template
 from jinja2 import TemplateNotFound
+from jinja2.ext import Extension
+from jinja2.parser import Parser
+from jinja2.runtime import Context as BaseContext
 
+from .caching import Cache
+from .caching import MemoryCache
 from .ctx import AppContext
+from .globals import _cv_app
 from .globals import app_ctx
+from .globals import session
 from .helpers import stream_with_context
 from .signals import before_render_template
 from .signals import template_rendered
 
 if t.TYPE_CHECKING:  # pragma: no cover
+    from .app import Flask
     from .sansio.app import App
     from .sansio.scaffold import Scaffold
 
 
+class LazyValue:
+    """Wrap a function so that its value is only computed if a template
+    uses it. A template context processor can return this as a value
+    instead of computing an expensive value for every template.
+
+    .. code-block:: python
+
+        @app.context_processor
+        def inject_stats():
+            return {"stats": LazyValue(load_stats)}
+
+    The function is called with no arguments the first time a template
+    accesses the name. The result is remembered for the rest of the
+    current context, so the function is called at most once per request
+    even if multiple templates use it.
+
+    Receivers of the :data:`~flask.before_render_template` and
+    :data:`~flask.template_rendered` signals see the wrapper in the
+    context, and can call :meth:`resolve` to get the value.
+
+    :param func: Called to compute the value. May be an async function.
+        With :func:`~flask.render_template_async`, an async function is
+        awaited before rendering, even if the template doesn't use it.
+
+    .. versionadded:: 3.2
+    """
+
+    __slots__ = ("func",)
+
+    def __init__(self, func: t.Callable[[], t.Any]) -> None:
+        self.func = func
+
+    def resolve(self) -> t.Any:
+        """Get the value, calling the function if it hasn't been called
+        yet in the current context.
+        """
+        ctx = _cv_app.get(None)
+
+        if ctx is None:
+            return self.func()
+
+        cache = ctx._lazy_template_values
+
+        try:
+            return cache[self.func]
+        except KeyError:
+            pass
+
+        rv = cache[self.func] = ctx.app.ensure_sync(self.func)()
+        return rv
+
+    async def resolve_async(self) -> t.Any:
+        """Like :meth:`resolve`, but awaits the function if it is async
+        instead of running it with :meth:`~flask.Flask.ensure_sync`. Used by
+        :func:`render_template_async` while an event loop is running.
+        """
+        ctx = _cv_app.get(None)
+        cache = ctx._lazy_template_values if ctx is not None else {}
+
+        try:
+            return cache[self.func]
+        except KeyError:
+            pass
+
+        rv = self.func()
+
+        if inspect.isawaitable(rv):
+            rv = await rv
+
+        cache[self.func] = rv
+        return rv
+
+
 def _default_template_ctx_processor() -> dict[str, t.Any]:
     """Default template context processor.  Injects `request`,
-    `session` and `g`.
+    `session` and `g`. The session is only loaded if it is used, since it
+    is added as the :data:`.session` proxy.
     """
     ctx = app_ctx._get_current_object()
     rv: dict[str, t.Any] = {"g": ctx.g}
 
     if ctx.has_request:
         rv["request"] = ctx.request
-        rv["session"] = ctx.session
+        rv["session"] = session
 
     return rv
 
 
+class Context(BaseContext):
+    """Works like a regular Jinja template context but resolves
+    :class:`LazyValue` variables when they are accessed.
+
+    .. versionadded:: 3.2
+    """
+
+    def resolve_or_missing(self, key: str) -> t.Any:
+        rv = super().resolve_or_missing(key)
+
+        if isinstance(rv, LazyValue):
+            return rv.resolve()
+
+        return rv
+
+
+class TemplateWatcher:
+    """Check template source files for changes in a background thread, so
+    that auto reload doesn't need to check each file every time a template
+    is rendered.
+
+    The loader calls :meth:`watch` for each template file it loads. A
+    thread started by the first call checks the modification time of every
+    watched file once each ``interval``. Templates loaded from a file that
+    changed are no longer up to date, and are loaded again the next time
+    they are rendered. Checking if a template is up to date is a dict
+    lookup instead of a call to :func:`os.stat`.
+
+    This is set as :attr:`Environment.template_watcher` when the
+    ``TEMPLATES_AUTO_RELOAD_INTERVAL`` config is set.
+
+    :param interval: Seconds to wait between checking all files.
+
+    .. versionadded:: 3.2
+    """
+
+    def __init__(self, interval: float = 1) -> None:
+        self.interval = interval
+        self._mtimes: dict[str, int | None] = {}
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def watch(self, filename: str) -> t.Callable[[], bool]:
+        """Start watching a template file if it isn't already. Returns a
+        function that returns ``False`` once the file has changed, which
+        Jinja uses to check if the loaded template is up to date.
+
+        :param filename: The path to the template source file.
+        """
+        with self._lock:
+            if filename not in self._mtimes:
+                self._mtimes[filename] = self._get_mtime(filename)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="flask-template-watcher", daemon=True
+                )
+                self._thread.start()
+
+            version = self._versions.get(filename, 0)
+
+        versions = self._versions
+        return lambda: versions.get(filename, 0) == version
+
+    def check(self) -> None:
+        """Check the modification time of every watched file once, and mark
+        the files that changed. This is called by the thread, but can be
+        called directly to check immediately.
+        """
+        with self._lock:
+            items = list(self._mtimes.items())
+
+        for filename, mtime in items:
+            new_mtime = self._get_mtime(filename)
+
+            if new_mtime != mtime:
+                with self._lock:
+                    self._mtimes[filename] = new_mtime
+                    self._versions[filename] = self._versions.get(filename, 0) + 1
+
+    def stop(self) -> None:
+        """Stop the thread. Files are not checked for changes after this."""
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    @staticmethod
+    def _get_mtime(filename: str) -> int | None:
+        try:
+            return os.stat(filename).st_mtime_ns
+        except OSError:
+            return None
+
+
 class Environment(BaseEnvironment):
     """Works like a regular Jinja environment but has some additional
     knowledge of how Flask's blueprint works so that it can prepend the
     name of the blueprint to referenced templates if necessary.
+
+    .. versionchanged:: 3.2
+        Uses :class:`Context`, which resolves :class:`LazyValue`
+        variables.
+
+    .. versionchanged:: 3.2
+        Added :attr:`template_watcher`.
     """
 
+    context_class = Context
+
+    #: Checks template files for changes in the background when
+    #: ``auto_reload`` is enabled, instead of checking on each render. Set
+    #: from the ``TEMPLATES_AUTO_RELOAD_INTERVAL`` config.
+    #:
+    #: .. versionadded:: 3.2
+    template_watcher: TemplateWatcher | None = None
+
     def __init__(self, app: App, **options: t.Any) -> None:
         if "loader" not in options:
             options["loader"] = app.create_global_jinja_loader()
@@ -45,20 +246,144 @@ class Environment(BaseEnvironment):
         self.app = app
 
 
+class FragmentCacheExtension(Extension):
+    """Adds a ``{% cache %}`` block to templates, which stores the rendered
+    output of the block and reuses it on later renders.
+
+    .. code-block:: jinja
+
+        {% cache "sidebar", 60 %}
+            {{ render_sidebar() }}
+        {% endcache %}
+
+    The first argument is the cache key, which should include anything
+    that changes the output, such as ``"sidebar-" ~ g.user.id``. The
+    optional second argument is the timeout in seconds, otherwise the
+    backend's default is used.
+
+    Enable it by adding it to the app's Jinja environment. It adds the
+    following attributes to the environment.
+
+    -   ``fragment_cache``: The :class:`~flask.caching.Cache` to store
+        fragments in. Defaults to a :class:`~flask.caching.MemoryCache`.
+    -   ``fragment_cache_bypass``: A function called with no arguments
+        before rendering each block. If it returns ``True``, the block is
+        rendered without using the cache. For example, to skip the cache
+        for logged in users for the current request.
+
+    .. code-block:: python
+
+        from flask.caching import FileSystemCache
+        from flask.templating import FragmentCacheExtension
+
+        app.jinja_env.add_extension(FragmentCacheExtension)
+        app.jinja_env.fragment_cache = FileSystemCache("/tmp/fragments")
+        app.jinja_env.fragment_cache_bypass = lambda: "nocache" in request.args
+
+    .. versionadded:: 3.2
+    """
+
+    tags = {"cache"}
+
+    def __init__(self, environment: BaseEnvironment) -> None:
+        super().__init__(environment)
+        environment.extend(fragment_cache=MemoryCache(), fragment_cache_bypass=None)
+
+    def parse(self, parser: Parser) -> nodes.Node:
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+
+        if parser.stream.skip_if("comma"):
+            args.append(parser.parse_expression())
+        else:
+            args.append(nodes.Const(None))
+
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        return nodes.CallBlock(
+            self.call_method("_cache", args), [], [], body
+        ).set_lineno(lineno)
+
+    def _cache(self, key: t.Any, timeout: float | None, caller: t.Any) -> t.Any:
+        env = self.environment
+        bypass = env.fragment_cache_bypass  # type: ignore[attr-defined]
+
+        if bypass is not None and bypass():
+            return caller()
+
+        cache = env.fragment_cache  # type: ignore[attr-defined]
+        key = f"flask.fragment:{key}"
+        rv = cache.get(key)
+
+        if rv is None:
+            rv = caller()
+
+            # With async rendering, the caller returns a coroutine.
+            if self.environment.is_async:
+                return self._set_async(cache, key, timeout, rv)
+
+            cache.set(key, rv, timeout)
+
+        return rv
+
+    async def _set_async(
+        self, cache: Cache, key: str, timeout: float | None, value: t.Any
+    ) -> t.Any:
+        rv = await value
+        cache.set(key, rv, timeout)
+        return rv
+
+
 class DispatchingJinjaLoader(BaseLoader):
     """A loader that looks for templates in the application and all
     the blueprint folders.
+
+    The loader that found each template is remembered, so later lookups
+    for the same name go directly to it instead of trying every loader
+    in order. This index is not used when the environment's
+    ``auto_reload`` is enabled, and is cleared when a blueprint is
+    registered.
+
+    .. versionchanged:: 3.2
+        Remember which loader found each template.
     """
 
     def __init__(self, app: App) -> None:
         self.app = app
+        self._index: dict[str, tuple[Scaffold, BaseLoader]] = {}
+        self._index_blueprints = 0
+
+    def _get_index(
+        self, environment: BaseEnvironment
+    ) -> dict[str, tuple[Scaffold, BaseLoader]] | None:
+        """Get the index of template names to the loader that found them,
+        or ``None`` if it should not be used. Templates may be added to or
+        removed from any loader while auto reload is enabled.
+        """
+        if environment.auto_reload:
+            return None
+
+        if len(self.app.blueprints) != self._index_blueprints:
+            self._index = {}
+            self._index_blueprints = len(self.app.blueprints)
+
+        return self._index
 
     def get_source(
         self, environment: BaseEnvironment, template: str
     ) -> tuple[str, str | None, t.Callable[[], bool] | None]:
         if self.app.config["EXPLAIN_TEMPLATE_LOADING"]:
-            return self._get_source_explained(environment, template)
-        return self._get_source_fast(environment, template)
+            rv = self._get_source_explained(environment, template)
+        else:
+            rv = self._get_source_fast(environment, template)
+
+        watcher = getattr(environment, "template_watcher", None)
+
+        # Replace the loader's check, which stats the file on every render,
+        # with a check of the watcher's record of changed files.
+        if watcher is not None and environment.auto_reload and rv[1] is not None:
+            return rv[0], rv[1], watcher.watch(rv[1])
+
+        return rv
 
     def _get_source_explained(
         self, environment: BaseEnvironment, template: str
@@ -87,11 +412,24 @@ class DispatchingJinjaLoader(BaseLoader):
     def _get_source_fast(
         self, environment: BaseEnvironment, template: str
     ) -> tuple[str, str | None, t.Callable[[], bool] | None]:
-        for _srcobj, loader in self._iter_loaders(template):
+        index = self._get_index(environment)
+
+        if index is not None and (found := index.get(template)) is not None:
             try:
-                return loader.get_source(environment, template)
+                return found[1].get_source(environment, template)
+            except TemplateNotFound:
+                index.pop(template, None)
+
+        for srcobj, loader in self._iter_loaders(template):
+            try:
+                rv = loader.get_source(environment, template)
             except TemplateNotFound:
                 continue
+
+            if index is not None:
+                index[template] = (srcobj, loader)
+
+            return rv
         raise TemplateNotFound(template)
 
     def _iter_loaders(self, template: str) -> t.Iterator[tuple[Scaffold, BaseLoader]]:
@@ -105,16 +443,17 @@ class DispatchingJinjaLoader(BaseLoader):
                 yield blueprint, loader
 
     def list_templates(self) -> list[str]:
-        result = set()
-        loader = self.app.jinja_loader
-        if loader is not None:
-            result.update(loader.list_templates())
+        result: dict[str, tuple[Scaffold, BaseLoader]] = {}
 
-        for blueprint in self.app.iter_blueprints():
-            loader = blueprint.jinja_loader
-            if loader is not None:
-                for template in loader.list_templates():
-                    result.add(template)
+        for srcobj, loader in self._iter_loaders(""):
+            for template in loader.list_templates():
+                # The first loader in order is the one that will be used.
+                result.setdefault(template, (srcobj, loader))
+
+        index = self._get_index(self.app.jinja_env)
+
+        if index is not None:
+            index.update(result)
 
         return list(result)
 
@@ -159,17 +498,86 @@ def render_template_string(source: str, **context: t.Any) -> str:
     return _render(ctx, template, context)
 
 
+def stream_flush() -> str:
+    """Mark a point in a template where buffered stream output should be
+    sent to the client, such as after the ``<head>`` section.
+
+    .. code-block:: jinja
+
+        </head>{{ stream_flush() }}
+
+    This is only used when the ``TEMPLATES_STREAM_BUFFER_SIZE`` config is
+    set and the template is rendered with :func:`stream_template`.
+    Otherwise it outputs nothing.
+
+    .. versionadded:: 3.2
+    """
+    return ""
+
+
+class _StreamBuffer:
+    """Join the small strings yielded by a template stream into chunks of at
+    least ``size`` characters, or up to a point marked by ``stream_flush()``.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.flush = False
+
+    def stream_flush(self) -> str:
+        self.flush = True
+        return ""
+
+    def coalesce(self, values: t.Iterable[str]) -> t.Iterator[str]:
+        buffer: list[str] = []
+        size = 0
+
+        for value in values:
+            buffer.append(value)
+            size += len(value)
+
+            if size >= self.size or self.flush:
+                if size:
+                    yield "".join(buffer)
+
+                buffer.clear()
+                size = 0
+                self.flush = False
+
+        if size:
+            yield "".join(buffer)
+
+
+def _stream_buffer(app: Flask, context: dict[str, t.Any]) -> _StreamBuffer | None:
+    buffer_size = app.config["TEMPLATES_STREAM_BUFFER_SIZE"]
+
+    if not buffer_size:
+        return None
+
+    buffer = _StreamBuffer(buffer_size)
+    context["stream_flush"] = buffer.stream_flush
+    return buffer
+
+
 def _stream(
     ctx: AppContext, template: Template, context: dict[str, t.Any]
 ) -> t.Iterator[str]:
     app = ctx.app
     app.update_template_context(ctx, context)
+    buffer = _stream_buffer(app, context)
     before_render_template.send(
         app, _async_wrapper=app.ensure_sync, template=template, context=context
     )
 
     def generate() -> t.Iterator[str]:
-        yield from template.generate(context)
+        values: t.Iterable[str] = template.generate(context)
+
+        # Jinja yields many small strings, join them so that the server
+        # makes fewer writes.
+        if buffer is not None:
+            values = buffer.coalesce(values)
+
+        yield from values
         template_rendered.send(
             app, _async_wrapper=app.ensure_sync, template=template, context=context
         )
@@ -209,3 +617,118 @@ def stream_template_string(source: str, **context: t.Any) -> t.Iterator[str]:
     ctx = app_ctx._get_current_object()
     template = ctx.app.jinja_env.from_string(source)
     return _stream(ctx, template, context)
+
+
+def _sync_to_async(func: t.Callable[..., t.Any]) -> t.Callable[..., t.Any]:
+    # Lets signal receivers that are not async be used with send_async.
+    async def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+async def _render_async(
+    ctx: AppContext, template: Template, context: dict[str, t.Any]
+) -> str:
+    app = ctx.app
+    await app.update_template_context_async(ctx, context)
+    await before_render_template.send_async(
+        app, _sync_wrapper=_sync_to_async, template=template, context=context
+    )
+    rv = await template.render_async(context)
+    await template_rendered.send_async(
+        app, _sync_wrapper=_sync_to_async, template=template, context=context
+    )
+    return rv
+
+
+async def render_template_async(
+    template_name_or_list: str | Template | list[str | Template],
+    **context: t.Any,
+) -> str:
+    """Render a template by name with the given context, without blocking
+    the event loop while waiting on async code. Use this in async views
+    instead of :func:`render_template`.
+
+    The template is loaded from :attr:`.Flask.jinja_env_async`, which has
+    async rendering enabled. Async context processors are awaited, and
+    async functions called in the template, such as async globals, are
+    awaited while rendering. Async signal receivers are awaited.
+
+    :param template_name_or_list: The name of the template to render. If
+        a list is given, the first name to exist will be rendered.
+    :param context: The variables to make available in the template.
+
+    .. versionadded:: 3.2
+    """
+    ctx = app_ctx._get_current_object()
+    template = ctx.app.jinja_env_async.get_or_select_template(template_name_or_list)
+    return await _render_async(ctx, template, context)
+
+
+def _iter_async(values: t.AsyncIterator[str]) -> t.Iterator[str]:
+    # The response is iterated after the view's event loop has finished.
+    # Use one loop for the whole stream, the async generator is bound to
+    # the loop that first runs it.
+    loop = asyncio.new_event_loop()
+
+    async def next_value() -> str | None:
+        try:
+            return await values.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    try:
+        while (value := loop.run_until_complete(next_value())) is not None:
+            yield value
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+async def _stream_async(
+    ctx: AppContext, template: Template, context: dict[str, t.Any]
+) -> t.Iterator[str]:
+    app = ctx.app
+    await app.update_template_context_async(ctx, context)
+    buffer = _stream_buffer(app, context)
+    await before_render_template.send_async(
+        app, _sync_wrapper=_sync_to_async, template=template, context=context
+    )
+
+    def generate() -> t.Iterator[str]:
+        values: t.Iterable[str] = _iter_async(template.generate_async(context))
+
+        if buffer is not None:
+            values = buffer.coalesce(values)
+
+        yield from values
+        template_rendered.send(
+            app, _async_wrapper=app.ensure_sync, template=template, context=context
+        )
+
+    return stream_with_context(generate())
+
+
+async def stream_template_async(
+    template_name_or_list: str | Template | list[str | Template],
+    **context: t.Any,
+) -> t.Iterator[str]:
+    """Render a template by name with the given context as a stream, using
+    :attr:`.Flask.jinja_env_async` like :func:`render_template_async`.
+
+    Async context processors and :data:`before_render_template` receivers
+    are awaited before this returns. The returned iterator of strings can
+    be used as a streaming response from a view. The template is rendered
+    as the response is sent, after the view has returned, in a new event
+    loop that is used for the rest of the stream.
+
+    :param template_name_or_list: The name of the template to render. If
+        a list is given, the first name to exist will be rendered.
+    :param context: The variables to make available in the template.
+
+    .. versionadded:: 3.2
+    """
+    ctx = app_ctx._get_current_object()
+    template = ctx.app.jinja_env_async.get_or_select_template(template_name_or_list)
+    return await _stream_async(ctx, template, context)
@@ -4,6 +4,8 @@ import typing as t
 
 from werkzeug.exceptions import BadRequest
 from werkzeug.exceptions import HTTPException
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.exceptions import UnsupportedMediaType
 from werkzeug.wrappers import Request as RequestBase
 from werkzeug.wrappers import Response as ResponseBase
 
@@ -14,6 +16,10 @@ from .helpers import _split_blueprint_path
 if t.TYPE_CHECKING:  # pragma: no cover
     from werkzeug.routing import Rule
 
+_json_lines_mimetypes = frozenset(
+    ("application/x-ndjson", "application/jsonl", "application/json-lines")
+)
+
 
 class Request(RequestBase):
     """The request object used by default in Flask.  Remembers the
@@ -218,6 +224,110 @@ class Request(RequestBase):
 
             raise BadRequest() from ebr
 
+    def iter_json_lines(
+        self,
+        force: bool = False,
+        silent: bool = False,
+        *,
+        max_line_size: int | None = None,
+        chunk_size: int = 65536,
+    ) -> t.Iterator[t.Any]:
+        """Iterate over the records in a newline delimited JSON body,
+        parsing each line as it is read from :attr:`stream`. Only the
+        current chunk and line are kept in memory, rather than the whole
+        body. Blank lines are skipped.
+
+        The body is read from :attr:`stream`, which enforces
+        :attr:`max_content_length`. It can only be consumed once.
+
+        .. code-block:: python
+
+            @app.post("/import")
+            def bulk_import():
+                for record in request.iter_json_lines():
+                    db.insert(record)
+
+                return "", 204
+
+        :param force: Parse the body even if the mimetype is not
+            ``application/x-ndjson``, ``application/jsonl``, or
+            ``application/json-lines``. Otherwise a 415 error is raised.
+        :param silent: Skip lines that fail to parse instead of calling
+            :meth:`on_json_line_loading_failed`.
+        :param max_line_size: Raise a 413 error if a line is longer than
+            this many bytes.
+        :param chunk_size: How many bytes to read from the stream at once.
+
+        .. versionadded:: 3.2
+        """
+        if not (force or self.mimetype in _json_lines_mimetypes):
+            raise UnsupportedMediaType(
+                "Did not attempt to load JSON lines because the request"
+                " Content-Type was not 'application/x-ndjson'."
+            )
+
+        loads = self.json_module.loads
+        stream = self.stream
+        buffer = bytearray()
+        lineno = 0
+
+        while True:
+            chunk = stream.read(chunk_size)
+            lines: list[bytearray] = []
+
+            if not chunk:
+                # End of the stream, the rest of the buffer is the last line.
+                lines.append(buffer)
+            elif b"\n" in chunk:
+                buffer += chunk
+                *lines, buffer = buffer.split(b"\n")
+            else:
+                buffer += chunk
+
+            for line in lines:
+                lineno += 1
+
+                if max_line_size is not None and len(line) > max_line_size:
+                    raise RequestEntityTooLarge()
+
+                if not line.strip():
+                    continue
+
+                try:
+                    value = loads(line)
+                except ValueError as e:
+                    if silent:
+                        continue
+
+                    value = self.on_json_line_loading_failed(e, lineno)
+
+                yield value
+
+            if not chunk:
+                return
+
+            if max_line_size is not None and len(buffer) > max_line_size:
+                raise RequestEntityTooLarge()
+
+    def on_json_line_loading_failed(self, e: ValueError, lineno: int) -> t.Any:
+        """Called if a line fails to parse during :meth:`iter_json_lines`
+        and it isn't silenced.
+
+        If this method returns a value, it is yielded in place of the
+        record. The default implementation raises
+        :exc:`~werkzeug.exceptions.BadRequest` with the line number. The
+        parse error is included in debug mode.
+
+        :param e: The exception raised while parsing.
+        :param lineno: The line number, starting at 1.
+
+        .. versionadded:: 3.2
+        """
+        if current_app and current_app.debug:
+            raise BadRequest(f"Failed to decode JSON on line {lineno}: {e}")
+
+        raise BadRequest(f"Failed to decode JSON on line {lineno}.")
+
 
 class Response(ResponseBase):
     """The response object that is used by default in Flask.  Works like the
@@ -1,7 +1,9 @@
 import asyncio
+import threading
 
 import pytest
 
+import flask
 from flask import Blueprint
 from flask import Flask
 from flask import request
@@ -143,3 +145,126 @@ def test_async_before_after_request():
     test_client.get("/bp/")
     assert bp_before_called
     assert bp_after_called
+
+
+def test_async_render_template():
+    from jinja2 import DictLoader
+
+    from flask import render_template_async
+    from flask import stream_template_async
+    from flask import template_rendered
+    from flask.templating import FragmentCacheExtension
+    from flask.templating import LazyValue
+
+    app = Flask(__name__)
+    app.jinja_env.add_extension(FragmentCacheExtension)
+    app.jinja_loader = DictLoader(
+        {
+            "index.html": (
+                "{{ a }} {{ b }} {{ c }} {{ load() }}"
+                " {% cache 'x' %}{{ load() }}{% endcache %}"
+            )
+        }
+    )
+    rendered = []
+
+    async def load():
+        await asyncio.sleep(0)
+        return "load"
+
+    async def get_c():
+        await asyncio.sleep(0)
+        return "c"
+
+    app.jinja_env.globals["load"] = load
+
+    @app.context_processor
+    async def inject():
+        await asyncio.sleep(0)
+        return {"a": "a", "c": LazyValue(get_c)}
+
+    @app.route("/")
+    async def index():
+        return await render_template_async("index.html", b="b")
+
+    @app.route("/stream")
+    async def stream():
+        return await stream_template_async("index.html", b="b")
+
+    def record(sender, template, context):
+        rendered.append(template.name)
+
+    template_rendered.connect(record, app)
+
+    try:
+        client = app.test_client()
+        assert client.get("/").data == b"a b c load load"
+        assert client.get("/stream").data == b"a b c load load"
+    finally:
+        template_rendered.disconnect(record, app)
+
+    assert rendered == ["index.html", "index.html"]
+
+
+def test_async_render_lazy_value():
+    from jinja2 import DictLoader
+
+    from flask import render_template_string
+    from flask.templating import LazyValue
+
+    app = Flask(__name__)
+    app.jinja_loader = DictLoader({"index.html": "x"})
+    calls = []
+
+    async def get_a():
+        calls.append("a")
+        return "a"
+
+    def get_b():
+        calls.append("b")
+        return "b"
+
+    @app.context_processor
+    def inject():
+        return {"a": LazyValue(get_a), "b": LazyValue(get_b)}
+
+    @app.route("/")
+    async def index():
+        return await flask.render_template_async("index.html")
+
+    # Async lazy values are awaited before rendering even if they are
+    # unused. Sync lazy values are only called if they are used.
+    assert app.test_client().get("/").data == b"x"
+    assert calls == ["a"]
+
+    with app.test_request_context():
+        assert render_template_string("{{ b }}") == "b"
+
+    assert calls == ["a", "b"]
+
+
+def test_single_flight():
+    app = Flask(__name__)
+    calls = []
+
+    @app.route("/")
+    @flask.single_flight
+    async def index():
+        calls.append(None)
+        await asyncio.sleep(0.1)
+        return "hello"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(app.test_client().get("/")))
+        for _ in range(3)
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert [rv.data for rv in results] == [b"hello"] * 3
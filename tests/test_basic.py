@@ -1,4 +1,5 @@
 import gc
+import os
 import re
 import typing as t
 import uuid
@@ -476,6 +477,58 @@ def test_session_special_types(app, client):
         assert s["di_tag"] == {" di": "not-a-dict"}
 
 
+def test_session_compress_threshold(app, client):
+    class MySessionInterface(flask.sessions.SecureCookieSessionInterface):
+        compress_threshold = 100
+
+    app.session_interface = MySessionInterface()
+
+    @app.route("/<int:n>")
+    def index(n):
+        flask.session["data"] = "a" * n
+        return ""
+
+    @app.route("/")
+    def read():
+        return str(len(flask.session.get("data", "")))
+
+    value = client.get("/10").headers["set-cookie"].split(";")[0].split("=", 1)[1]
+    assert not value.startswith(".")
+    assert client.get("/").data == b"10"
+    value = client.get("/200").headers["set-cookie"].split(";")[0].split("=", 1)[1]
+    assert value.startswith(".")
+    assert client.get("/").data == b"200"
+
+
+def test_session_too_large(app, client):
+    class MySessionInterface(flask.sessions.SecureCookieSessionInterface):
+        max_cookie_value_size = 200
+
+    app.session_interface = MySessionInterface()
+
+    @app.route("/<int:n>")
+    def index(n):
+        flask.session["data"] = os.urandom(n)
+        return ""
+
+    assert "set-cookie" in client.get("/10").headers
+
+    with pytest.raises(RuntimeError, match="max_cookie_value_size"):
+        client.get("/200")
+
+    class SpillSessionInterface(MySessionInterface):
+        def session_too_large(self, app, session, value):
+            return None
+
+    app.session_interface = SpillSessionInterface()
+    assert client.get_cookie("session") is not None
+    # The outdated cookie from the earlier request is deleted.
+    rv = client.get("/200")
+    assert "Max-Age=0" in rv.headers["set-cookie"]
+    assert rv.headers["Vary"] == "Cookie"
+    assert client.get_cookie("session") is None
+
+
 def test_session_cookie_setting(app):
     is_permanent = True
 
@@ -604,6 +657,32 @@ def test_flashes(app, req_ctx):
     assert list(flask.get_flashed_messages()) == ["Zap", "Zip"]
 
 
+def test_cookie_flashes(app, client):
+    app.flash_interface = flask.flashing.CookieFlashInterface()
+
+    @app.route("/")
+    def index():
+        flask.flash("Hello World")
+        flask.flash(Markup("<em>Testing</em>"), "warning")
+        return ""
+
+    @app.route("/test/")
+    def test():
+        return repr(flask.get_flashed_messages(with_categories=True))
+
+    rv = client.get("/")
+    assert client.get_cookie("session") is None
+    assert client.get_cookie("flashes") is not None
+    assert rv.headers["Vary"] == "Cookie"
+    rv = client.get("/test/")
+    assert rv.text == repr(
+        [("message", "Hello World"), ("warning", Markup("<em>Testing</em>"))]
+    )
+    assert client.get_cookie("session") is None
+    assert client.get_cookie("flashes") is None
+    assert client.get("/test/").text == "[]"
+
+
 def test_extended_flashing(app):
     # Be sure app.testing=True below, else tests can fail silently.
     #
@@ -1330,6 +1409,30 @@ def test_json_dump_dataclass(app, req_ctx):
     assert value == {"name": "Flask"}
 
 
+def test_json_dump_nested_dataclass(app, req_ctx):
+    from dataclasses import dataclass
+
+    @dataclass(slots=True)
+    class Item:
+        id: uuid.UUID
+
+    @dataclass
+    class Order:
+        items: list[Item]
+        extra: dict[str, Item]
+
+    the_uuid = uuid.uuid4()
+    value = app.json.dumps(Order([Item(the_uuid)], {"a": Item(the_uuid)}))
+    value = app.json.loads(value)
+    assert value == {
+        "items": [{"id": str(the_uuid)}],
+        "extra": {"a": {"id": str(the_uuid)}},
+    }
+
+    with pytest.raises(TypeError):
+        app.json.dumps(Order)
+
+
 def test_jsonify_args_and_kwargs_check(app, req_ctx):
     with pytest.raises(TypeError) as e:
         flask.jsonify("fake args", kwargs="fake")
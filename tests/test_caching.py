@@ -0,0 +1,189 @@
+import time
+
+import pytest
+
+import flask
+from flask import request
+from flask import session
+from flask.caching import FileSystemCache
+from flask.caching import MemoryCache
+
+
+@pytest.fixture(params=["memory", "filesystem"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCache(max_entries=2)
+
+    return FileSystemCache(tmp_path)
+
+
+def test_get_set(cache):
+    assert cache.get("a") is None
+    cache.set("a", {"value": 1})
+    assert cache.get("a") == {"value": 1}
+    cache.delete("a")
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_timeout(cache, monkeypatch):
+    cache.set("a", 1, timeout=10)
+    cache.set("b", 2, timeout=0)
+    now = time.time() + 20
+    monotonic = time.monotonic() + 20
+    monkeypatch.setattr(time, "time", lambda: now)
+    monkeypatch.setattr(time, "monotonic", lambda: monotonic)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_memory_lru():
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_filesystem_shared(tmp_path):
+    FileSystemCache(tmp_path).set("a", 1)
+    assert FileSystemCache(tmp_path).get("a") == 1
+
+
+def test_memory_max_size():
+    cache = MemoryCache(max_entries=None, max_size=10)
+    cache.set("a", b"12345")
+    cache.set("b", "12345")
+    assert cache.get("a") == b"12345"
+    cache.set("c", b"123")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"12345"
+    cache.set("d", b"12345678901")
+    assert cache.get("d") is None
+    assert cache.get("c") == b"123"
+
+
+@pytest.mark.parametrize("backend", ["memory", "filesystem"])
+def test_cache_response(app, client, backend, tmp_path):
+    if backend == "filesystem":
+        app.config["RESPONSE_CACHE_DIR"] = tmp_path
+
+    calls = []
+
+    @app.route("/")
+    @app.cache_response(ttl=60)
+    def index():
+        calls.append(None)
+        return f"{request.args.get('q')} {request.headers.get('X-Lang')}"
+
+    @app.after_request
+    def add_vary(response):
+        calls.append(None)
+        response.vary.add("X-Lang")
+        return response
+
+    assert client.get("/?q=a").data == b"a None"
+    assert len(calls) == 2
+    rv = client.get("/?q=a")
+    assert rv.data == b"a None"
+    assert rv.headers["Vary"] == "X-Lang"
+    assert len(calls) == 2
+    assert client.get("/?q=b").data == b"b None"
+    assert client.get("/?q=a", headers={"X-Lang": "fr"}).data == b"a fr"
+    assert len(calls) == 6
+    assert client.get("/?q=a", headers={"X-Lang": "fr"}).data == b"a fr"
+    assert len(calls) == 6
+
+
+def test_cache_response_bypass(app, client):
+    calls = []
+
+    @app.route("/session")
+    @app.cache_response()
+    def use_session():
+        calls.append(None)
+        return str(session.get("a"))
+
+    @app.route("/cookie")
+    @app.cache_response()
+    def set_cookie():
+        calls.append(None)
+        rv = flask.make_response("")
+        rv.set_cookie("a", "b")
+        return rv
+
+    @app.route("/error")
+    @app.cache_response()
+    def error():
+        calls.append(None)
+        flask.abort(404)
+
+    for path in ("/session", "/cookie", "/error"):
+        client.get(path)
+        client.get(path)
+
+    assert len(calls) == 6
+
+
+def test_cache_response_host(app, client):
+    @app.route("/")
+    @app.cache_response()
+    def index():
+        return request.host
+
+    assert client.get("/", base_url="http://a.test").data == b"a.test"
+    assert client.get("/", base_url="http://b.test").data == b"b.test"
+
+
+def test_cache_response_authorization(app, client):
+    calls = []
+
+    @app.route("/private")
+    @app.cache_response()
+    def private():
+        calls.append(None)
+        return str(request.authorization is not None)
+
+    @app.route("/public")
+    @app.cache_response()
+    def public():
+        calls.append(None)
+        rv = flask.make_response("public")
+        rv.cache_control.public = True
+        return rv
+
+    auth = {"Authorization": "Bearer abc"}
+    assert client.get("/private", headers=auth).data == b"True"
+    assert client.get("/private").data == b"False"
+    assert client.get("/private", headers=auth).data == b"True"
+    assert len(calls) == 3
+    assert client.get("/private").data == b"False"
+    assert len(calls) == 3
+
+    client.get("/public", headers=auth)
+    client.get("/public", headers=auth)
+    client.get("/public")
+    assert len(calls) == 4
+
+
+def test_cache_response_signal(app, client):
+    statuses = []
+
+    def record(sender, response):
+        statuses.append(response.status_code)
+
+    @app.route("/")
+    @app.cache_response()
+    def index():
+        return "hello"
+
+    with flask.request_finished.connected_to(record, app):
+        client.get("/")
+        client.get("/")
+
+    assert statuses == [200, 200]
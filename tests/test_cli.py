@@ -1,6 +1,8 @@
 # This file was part of Flask-CLI and was modified under the terms of
 # its Revised BSD License. Copyright © 2015 CERN.
+import gzip
 import importlib.metadata
+import json
 import os
 import platform
 import ssl
@@ -518,6 +520,64 @@ class TestRoutes:
         assert "Host" in result.output
 
 
+def test_templates_compile(runner, tmp_path):
+    from jinja2 import DictLoader
+
+    app = Flask(__name__, instance_path=str(tmp_path))
+    app.config["TEMPLATES_BYTECODE_CACHE"] = "jinja_cache"
+    app.jinja_loader = DictLoader({"a.html": "{{ a }}", "b.html": "{% if %}"})
+    cli = FlaskGroup(create_app=lambda: app)
+    result = runner.invoke(cli, ["templates", "compile"])
+    assert result.exit_code == 1
+    assert "Compiled 1 templates." in result.output
+    assert "'b.html'" in result.output
+    assert len(os.listdir(tmp_path / "jinja_cache")) == 1
+
+
+def test_templates_compile_jobs(runner, tmp_path, monkeypatch):
+    (tmp_path / "compileapp.py").write_text(
+        "import os\n"
+        "from jinja2 import DictLoader\n"
+        "from flask import Flask\n"
+        "app = Flask(__name__, instance_path=os.path.dirname(__file__))\n"
+        "app.config['TEMPLATES_BYTECODE_CACHE'] = 'jinja_cache'\n"
+        "app.jinja_loader = DictLoader({n: '{{ a }}' for n in 'abcd'})\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delitem(sys.modules, "compileapp", raising=False)
+    result = runner.invoke(
+        FlaskGroup(), ["--app", "compileapp", "templates", "compile", "-j", "2"]
+    )
+    sys.modules.pop("compileapp", None)
+    assert result.exit_code == 0, result.output
+    assert "Compiled 4 templates." in result.output
+    assert len(os.listdir(tmp_path / "jinja_cache")) == 4
+
+
+def test_static_compress(runner, tmp_path):
+    app = Flask(__name__, static_folder=str(tmp_path))
+    (tmp_path / "a.css").write_text("a" * 2000)
+    (tmp_path / "small.css").write_text("a")
+    cli = FlaskGroup(create_app=lambda: app)
+    result = runner.invoke(cli, ["static", "compress"])
+    assert result.exit_code == 0
+    assert gzip.decompress((tmp_path / "a.css.gz").read_bytes()) == b"a" * 2000
+    assert not (tmp_path / "small.css.gz").exists()
+    result = runner.invoke(cli, ["static", "compress"])
+    assert "Wrote 0 compressed files." in result.output
+
+
+def test_static_manifest(runner, tmp_path):
+    app = Flask(__name__, static_folder=str(tmp_path))
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "a.css").write_text("a")
+    cli = FlaskGroup(create_app=lambda: app)
+    result = runner.invoke(cli, ["static", "manifest"])
+    assert result.exit_code == 0
+    manifest = json.loads((tmp_path / "static-manifest.json").read_text())
+    assert list(manifest) == ["css/a.css"]
+
+
 def dotenv_not_available():
     try:
         import dotenv  # noqa: F401
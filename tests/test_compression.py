@@ -0,0 +1,94 @@
+import gzip
+import zlib
+
+import pytest
+
+import flask
+
+
+@pytest.fixture
+def app(app):
+    app.config["COMPRESS_RESPONSES"] = True
+    app.config["COMPRESS_MIN_SIZE"] = 10
+    return app
+
+
+def test_compress(app, client):
+    @app.route("/")
+    def index():
+        rv = flask.make_response("a" * 100)
+        rv.set_etag("abc")
+        return rv
+
+    rv = client.get("/", headers={"Accept-Encoding": "gzip, deflate"})
+    assert rv.headers["Content-Encoding"] == "gzip"
+    assert rv.headers["Vary"] == "Accept-Encoding"
+    assert rv.content_length == len(rv.data)
+    assert rv.get_etag() == ("abc", True)
+    assert gzip.decompress(rv.data) == b"a" * 100
+
+    rv = client.get("/", headers={"Accept-Encoding": "deflate"})
+    assert rv.headers["Content-Encoding"] == "deflate"
+    assert zlib.decompress(rv.data) == b"a" * 100
+
+    rv = client.get("/")
+    assert "Content-Encoding" not in rv.headers
+    assert rv.headers["Vary"] == "Accept-Encoding"
+    assert rv.data == b"a" * 100
+
+
+def test_skip(app, client):
+    @app.route("/small")
+    def small():
+        return "a"
+
+    @app.route("/binary")
+    def binary():
+        return flask.Response(b"a" * 100, mimetype="application/octet-stream")
+
+    @app.route("/encoded")
+    def encoded():
+        return "a" * 100, {"Content-Encoding": "br"}
+
+    @app.route("/file")
+    def file():
+        return flask.send_file("static/index.html", mimetype="text/html")
+
+    @app.route("/partial")
+    def partial():
+        rv = flask.make_response("a" * 100)
+        return rv.make_conditional(
+            flask.request, accept_ranges=True, complete_length=100
+        )
+
+    headers = {"Accept-Encoding": "gzip"}
+
+    for path in ("/small", "/binary", "/file", "/partial"):
+        rv = client.get(path, headers=headers)
+        assert "Content-Encoding" not in rv.headers
+        rv.close()
+
+    assert client.get("/encoded", headers=headers).data == b"a" * 100
+
+    rv = client.get("/partial", headers={**headers, "Range": "bytes=0-9"})
+    assert rv.status_code == 206
+    assert "Content-Encoding" not in rv.headers
+    assert rv.data == b"a" * 10
+
+
+def test_stream(app, client):
+    @app.route("/")
+    def index():
+        return flask.stream_template_string(
+            "{% for i in range(3) %}{{ i }}{% endfor %}"
+        )
+
+    rv = client.get("/", headers={"Accept-Encoding": "gzip"}, buffered=False)
+    assert rv.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in rv.headers
+    decompressor = zlib.decompressobj(31)
+    # Each chunk can be decompressed as soon as it arrives.
+    chunks = [decompressor.decompress(chunk) for chunk in rv.response]
+    rv.close()
+    assert chunks[:3] == [b"0", b"1", b"2"]
+    assert b"".join(chunks) == b"012"
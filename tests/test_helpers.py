@@ -1,5 +1,7 @@
 import io
 import os
+import threading
+import time
 
 import pytest
 import werkzeug.exceptions
@@ -98,6 +100,197 @@ class TestSendfile:
         assert rv.data.strip() == b"Hello Subdomain"
         rv.close()
 
+    def test_static_file_cache(self, tmp_path):
+        app = flask.Flask(__name__, static_folder=tmp_path, static_url_path="/static")
+        app.config["STATIC_FILE_CACHE_SIZE"] = 10
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"abcdef")
+        (tmp_path / "big.txt").write_bytes(b"x" * 20)
+        client = app.test_client()
+
+        rv = client.get("/static/a.txt")
+        assert rv.data == b"abcdef"
+        assert rv.mimetype == "text/plain"
+        etag = rv.headers["ETag"]
+        rv = client.get("/static/a.txt", headers={"If-None-Match": etag})
+        assert rv.status_code == 304
+        rv = client.get("/static/a.txt", headers={"Range": "bytes=1-2"})
+        assert rv.status_code == 206
+        assert rv.data == b"bc"
+
+        # The ETag matches the one send_file generates.
+        with app.test_request_context():
+            rv = flask.send_from_directory(tmp_path, "a.txt")
+            assert rv.headers["ETag"] == etag
+            rv.close()
+
+        path.write_bytes(b"ghi")
+        os.utime(path, ns=(0, 0))
+        rv = client.get("/static/a.txt")
+        assert rv.data == b"ghi"
+        assert rv.headers["ETag"] != etag
+
+        # Large and missing files are sent without the cache.
+        with app.test_request_context():
+            rv = app.send_static_file("a.txt")
+            assert not rv.direct_passthrough
+            rv = app.send_static_file("big.txt")
+            assert rv.direct_passthrough
+            rv.close()
+
+        assert client.get("/static/missing.txt").status_code == 404
+
+    def test_send_precompressed(self, app, tmp_path):
+        app.config["SEND_FILE_PRECOMPRESSED"] = True
+        (tmp_path / "a.js").write_text("a")
+        (tmp_path / "a.js.gz").write_text("gz")
+        (tmp_path / "a.js.br").write_text("br")
+
+        def send(accept, name="a.js"):
+            headers = {"Accept-Encoding": accept} if accept else {}
+
+            with app.test_request_context(headers=headers):
+                rv = flask.send_from_directory(tmp_path, name)
+                rv.direct_passthrough = False
+                rv.make_sequence()
+                rv.close()
+                return rv
+
+        rv = send("gzip, br")
+        assert rv.data == b"br"
+        assert rv.headers["Content-Encoding"] == "br"
+        assert rv.mimetype == "text/javascript"
+        assert rv.vary.as_set() == {"accept-encoding"}
+        rv = send("gzip, br;q=0.5")
+        assert rv.data == b"gz"
+        assert rv.headers["Content-Encoding"] == "gzip"
+        assert rv.headers["ETag"] != send("br").headers["ETag"]
+        rv = send(None)
+        assert rv.data == b"a"
+        assert "Content-Encoding" not in rv.headers
+        assert rv.vary.as_set() == {"accept-encoding"}
+
+    def test_static_hashed_urls(self, tmp_path):
+        app = flask.Flask(__name__, static_folder=tmp_path, static_url_path="/s")
+        app.config["STATIC_HASHED_URLS"] = True
+        bp = flask.Blueprint("bp", __name__, static_folder=tmp_path / "bp")
+        app.register_blueprint(bp, url_prefix="/bp")
+        (tmp_path / "bp").mkdir()
+        (tmp_path / "bp" / "b.js").write_text("b")
+        path = tmp_path / "a.min.css"
+        path.write_text("a")
+        client = app.test_client()
+
+        def get(url):
+            rv = client.get(url)
+            rv.get_data()
+            rv.close()
+            return rv
+
+        with app.test_request_context():
+            url = flask.url_for("static", filename="a.min.css")
+            assert url.startswith("/s/a.min.")
+            assert url.endswith(".css")
+            assert len(url) == len("/s/a.min.css") + 13
+            assert flask.url_for("static", filename="missing.css") == "/s/missing.css"
+            bp_url = flask.url_for("bp.static", filename="b.js")
+            assert bp_url.startswith("/bp/bp/b.")
+
+        rv = get(url)
+        assert rv.data == b"a"
+        assert rv.cache_control.immutable
+        assert rv.cache_control.max_age == 31_536_000
+        assert get(bp_url).cache_control.immutable
+        rv = get("/s/a.min.css")
+        assert rv.data == b"a"
+        assert not rv.cache_control.immutable
+
+        # A hash for outdated content is not cached forever.
+        path.write_text("changed")
+        rv = get(url)
+        assert rv.data == b"changed"
+        assert not rv.cache_control.immutable
+
+        with app.test_request_context():
+            assert flask.url_for("static", filename="a.min.css") != url
+
+        # The manifest is used instead of hashing the file.
+        (tmp_path / "static-manifest.json").write_text('{"c.css": "0123456789ab"}')
+        app = flask.Flask(__name__, static_folder=tmp_path, static_url_path="/s")
+        app.config["STATIC_HASHED_URLS"] = True
+
+        with app.test_request_context():
+            url = flask.url_for("static", filename="c.css")
+            assert url == "/s/c.0123456789ab.css"
+
+    def test_send_file_mmap(self, app, tmp_path):
+        path = tmp_path / "a.bin"
+        path.write_bytes(b"abcdef")
+
+        def send(headers=None):
+            with app.test_request_context(headers=headers):
+                rv = flask.send_from_directory(tmp_path, "a.bin")
+                rv.direct_passthrough = False
+                rv.make_sequence()
+                rv.close()
+                return rv
+
+        app.config["SEND_FILE_MMAP_CACHE_SIZE"] = 1
+        app.config["SEND_FILE_MMAP_MIN_SIZE"] = 1
+        # Full downloads are sent normally, so the server can use sendfile.
+        rv = send()
+        assert rv.data == b"abcdef"
+        assert not app.mapped_file_cache._mappings
+        etag = rv.headers["ETag"]
+        rv = send({"Range": "bytes=2-3"})
+        assert app.mapped_file_cache._mappings
+        assert rv.status_code == 206
+        assert rv.data == b"cd"
+        assert rv.headers["ETag"] == etag
+        assert rv.headers["Content-Range"] == "bytes 2-3/6"
+        assert rv.mimetype == "application/octet-stream"
+
+        path.write_bytes(b"ghi")
+        os.utime(path, ns=(0, 0))
+        assert send({"Range": "bytes=0-1"}).data == b"gh"
+
+    def test_send_file_path_cache(self, app, tmp_path, monkeypatch):
+        app.config["SEND_FILE_PATH_CACHE_TTL"] = 60
+        app.config["SEND_FILE_PATH_CACHE_NOT_FOUND_TTL"] = 60
+        (tmp_path / "a.txt").write_text("a")
+        calls = []
+        isfile = os.path.isfile
+        monkeypatch.setattr(os.path, "isfile", lambda p: calls.append(p) or isfile(p))
+
+        def send(name):
+            with app.test_request_context():
+                rv = flask.send_from_directory(tmp_path, name)
+                rv.close()
+
+        send("a.txt")
+        send("a.txt")
+        assert len(calls) == 1
+
+        with pytest.raises(werkzeug.exceptions.NotFound):
+            send("b.txt")
+
+        (tmp_path / "b.txt").write_text("b")
+
+        with pytest.raises(werkzeug.exceptions.NotFound):
+            send("b.txt")
+
+        app.send_file_path_cache.invalidate(tmp_path, "b.txt")
+        send("b.txt")
+
+        # A removed file is a 404 error even though its path was remembered.
+        (tmp_path / "a.txt").unlink()
+
+        with pytest.raises(werkzeug.exceptions.NotFound):
+            send("a.txt")
+
+        (tmp_path / "a.txt").write_text("a")
+        send("a.txt")
+
 
 class TestUrlFor:
     def test_url_for_with_anchor(self, app, req_ctx):
@@ -214,6 +407,183 @@ def test_abort_with_app(app):
         flask.abort(900)
 
 
+def test_check_etag(app, client):
+    calls = []
+
+    @app.route("/")
+    def index():
+        flask.check_etag("v1")
+        calls.append(None)
+        return "hello"
+
+    rv = client.get("/")
+    assert rv.get_etag() == ("v1", False)
+    assert len(calls) == 1
+    rv = client.get("/", headers={"If-None-Match": '"v1"'})
+    assert rv.status_code == 304
+    assert rv.get_etag() == ("v1", False)
+    assert rv.data == b""
+    assert len(calls) == 1
+    rv = client.get("/", headers={"If-None-Match": '"v0"'})
+    assert rv.status_code == 200
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("weak", [False, True])
+def test_etag_responses(app, client, weak):
+    app.config["ETAG_RESPONSES"] = True
+    app.config["ETAG_WEAK"] = weak
+
+    @app.route("/")
+    def index():
+        return {"a": flask.request.args.get("a")}
+
+    @app.route("/stream")
+    def stream():
+        return iter(["a"])
+
+    @app.post("/post")
+    def post():
+        return "hello"
+
+    rv = client.get("/")
+    etag, is_weak = rv.get_etag()
+    assert etag is not None
+    assert is_weak is weak
+    rv = client.get("/", headers={"If-None-Match": rv.headers["ETag"]})
+    assert rv.status_code == 304
+    assert rv.data == b""
+    assert client.get("/?a=b").get_etag()[0] != etag
+    assert client.get("/stream").get_etag() == (None, None)
+    assert client.post("/post").get_etag() == (None, None)
+
+
+def join_threads(threads):
+    for thread in threads:
+        thread.join(5)
+        assert not thread.is_alive()
+
+
+class TestSingleFlight:
+    def test_share(self, app):
+        paths = ["/a", "/a", "/a", "/missing", "/missing"]
+        # Every request and the test wait for each other before the first
+        # calls to the view are released.
+        barrier = threading.Barrier(len(paths) + 1, timeout=5)
+        calls = []
+        release = threading.Event()
+
+        def key():
+            barrier.wait()
+            return flask.request.path
+
+        @app.route("/<name>")
+        @flask.single_flight(key=key)
+        def index(name):
+            calls.append(name)
+            release.wait(5)
+
+            if name == "missing":
+                flask.abort(404)
+
+            return name
+
+        results = []
+
+        def get(path):
+            results.append(app.test_client().get(path))
+
+        threads = [threading.Thread(target=get, args=(path,)) for path in paths]
+
+        for thread in threads:
+            thread.start()
+
+        barrier.wait()
+        # Let every thread reach the wait for the first call.
+        time.sleep(0.05)
+        release.set()
+        join_threads(threads)
+
+        assert sorted(calls) == ["a", "missing"]
+        assert sorted(rv.status_code for rv in results) == [200, 200, 200, 404, 404]
+        assert [rv.data for rv in results if rv.status_code == 200] == [b"a"] * 3
+
+    def test_exception(self, app):
+        barrier = threading.Barrier(4, timeout=5)
+        errors = []
+        release = threading.Event()
+
+        def key():
+            barrier.wait()
+            return "a"
+
+        @app.route("/")
+        @flask.single_flight(key=key)
+        def index():
+            release.wait(5)
+            raise ValueError("a")
+
+        @app.errorhandler(ValueError)
+        def handle_value_error(e):
+            errors.append(e)
+            return "", 500
+
+        threads = [
+            threading.Thread(target=app.test_client().get, args=("/",))
+            for _ in range(3)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        barrier.wait()
+        time.sleep(0.05)
+        release.set()
+        join_threads(threads)
+
+        assert len({id(e) for e in errors}) == 3
+        assert all(e.args == ("a",) for e in errors)
+        original = next(e for e in errors if e.__cause__ is None)
+        assert all(e.__cause__ is original for e in errors if e is not original)
+
+    def test_default_key(self, app):
+        from flask.helpers import _single_flight_key
+
+        keys = set()
+
+        for headers in ({}, {"Cookie": "a=b"}, {"Authorization": "Bearer a"}):
+            with app.test_request_context(headers=headers):
+                keys.add(_single_flight_key())
+
+        with app.test_request_context(method="POST"):
+            assert _single_flight_key() is None
+
+        assert len(keys) == 3
+
+    def test_timeout(self, app, client):
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        @app.route("/")
+        @flask.single_flight(timeout=0)
+        def index():
+            calls.append(None)
+
+            if len(calls) == 1:
+                started.set()
+                release.wait(5)
+
+            return str(len(calls))
+
+        thread = threading.Thread(target=app.test_client().get, args=("/",))
+        thread.start()
+        assert started.wait(5)
+        assert client.get("/").data == b"2"
+        release.set()
+        join_threads([thread])
+
+
 class TestNoImports:
     """Test Flasks are created without import.
 
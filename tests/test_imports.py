@@ -0,0 +1,93 @@
+import subprocess
+import sys
+
+import pytest
+
+import flask
+
+# Dependencies and submodules that are only needed to render templates, use
+# the CLI, sign sessions, debug, or test. Importing Flask must not import them.
+lazy_modules = {
+    "click",
+    "itsdangerous",
+    "jinja2",
+    "flask.cli",
+    "flask.debughelpers",
+    "flask.templating",
+    "flask.testing",
+}
+
+
+def get_import_times(name):
+    """Import a module in a new interpreter with ``-X importtime``, and return
+    the cumulative time in microseconds to import each module.
+    """
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {name}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    rv = {}
+
+    for line in out.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        _, cumulative, module = line.removeprefix("import time:").split("|")
+
+        if cumulative.strip().isdigit():
+            rv[module.strip()] = int(cumulative)
+
+    return rv
+
+
+def test_lazy_modules():
+    assert not lazy_modules & get_import_times("flask").keys()
+
+
+def test_import_time_budget():
+    # Werkzeug is always needed. Compare against it, instead of an absolute
+    # time, so that the budget doesn't depend on the speed of the machine.
+    # Take the best of a few runs to reduce noise.
+    ratios = []
+
+    for _ in range(3):
+        times = get_import_times("flask")
+        ratios.append((times["flask"] - times["werkzeug"]) / times["werkzeug"])
+
+    assert min(ratios) < 1.5
+
+
+@pytest.mark.parametrize("name", ["render_template", "stream_template_string"])
+def test_lazy_attribute(name):
+    import flask.templating
+
+    assert getattr(flask, name) is getattr(flask.templating, name)
+
+
+def test_lazy_submodule():
+    # Run in a new interpreter, since other tests import the submodules.
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import flask; flask.cli.FlaskGroup; flask.templating.Environment;"
+            " assert {'cli', 'templating'} <= set(dir(flask))",
+        ],
+        check=True,
+    )
+
+
+def test_star_import():
+    namespace = {}
+    exec("from flask import *", namespace)
+    assert namespace["render_template"] is flask.render_template
+    assert namespace["Flask"] is flask.Flask
+    assert "render_template" in dir(flask)
+    assert set(flask.__all__) <= set(dir(flask))
+
+
+def test_missing_attribute():
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        flask.missing  # noqa: B018
@@ -257,6 +257,27 @@ def test_json_customization(app, client):
     assert rv.data == b'"<42>"'
 
 
+def test_json_dumps_bytes(app, client):
+    class CustomProvider(DefaultJSONProvider):
+        def dumps_bytes(self, obj, **kwargs):
+            return b'{"custom":true}'
+
+    app.json = CustomProvider(app)
+
+    @app.route("/jsonify")
+    def return_jsonify():
+        return flask.jsonify(a=1)
+
+    @app.route("/dict")
+    def return_dict():
+        return {"a": 1}
+
+    for url in ("/jsonify", "/dict"):
+        rv = client.get(url)
+        assert rv.data == b'{"custom":true}\n'
+        assert rv.content_length == 16
+
+
 def _has_encoding(name):
     try:
         import codecs
@@ -344,3 +365,74 @@ def test_html_method():
 
     result = json.dumps(ObjectWithHTML())
     assert result == '"<p>test</p>"'
+
+
+@pytest.mark.parametrize(
+    ("lines", "buffer_size", "expect"),
+    [
+        (False, 8192, [b'[{"a": 1},{"a": 2}]\n']),
+        (False, 0, [b'[{"a": 1}', b',{"a": 2}', b"]\n"]),
+        (True, 0, [b'{"a": 1}', b'\n{"a": 2}', b"\n"]),
+    ],
+)
+def test_stream_json(app, client, lines, buffer_size, expect):
+    @app.route("/")
+    def index():
+        def generate():
+            for i in range(1, 3):
+                yield {flask.request.args["key"]: i}
+
+        return json.stream_json(generate(), lines=lines, buffer_size=buffer_size)
+
+    rv = client.get("/?key=a", buffered=False)
+    assert list(rv.response) == expect
+    assert rv.mimetype == ("application/x-ndjson" if lines else "application/json")
+
+
+@pytest.mark.parametrize(("lines", "expect"), [(False, b"[]\n"), (True, b"")])
+def test_stream_json_empty(app, client, lines, expect):
+    @app.route("/")
+    def index():
+        return json.stream_json([], lines=lines)
+
+    assert client.get("/").data == expect
+
+
+def test_cached_response(app, client):
+    calls = []
+    version = 1
+
+    def get_obj():
+        calls.append(version)
+        return {"version": version}
+
+    @app.route("/")
+    def index():
+        return app.json.cached_response("data", get_obj, version=version)
+
+    rv = client.get("/")
+    assert rv.json == {"version": 1}
+    etag = rv.headers["ETag"]
+    assert client.get("/").data == rv.data
+    assert calls == [1]
+
+    rv = client.get("/", headers={"If-None-Match": etag})
+    assert rv.status_code == 304
+    assert rv.data == b""
+
+    version = 2
+    rv = client.get("/", headers={"If-None-Match": etag})
+    assert rv.status_code == 200
+    assert rv.json == {"version": 2}
+    assert rv.headers["ETag"] != etag
+    assert calls == [1, 2]
+
+
+def test_cached_response_max_entries(app):
+    app.json.cached_response_max_entries = 2
+
+    with app.test_request_context():
+        for key in ("a", "b", "a", "c"):
+            app.json.cached_response(key, lambda: [])
+
+    assert list(app.json._response_cache) == ["a", "c"]
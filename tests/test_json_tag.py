@@ -84,3 +84,41 @@ def test_tag_order():
 
     s.register(Tag2, index=None)
     assert isinstance(s.order[-1], Tag2)
+
+
+def test_tag_type_dispatch():
+    class TagUpper(JSONTag):
+        __slots__ = ()
+        key = " up"
+        types = (str,)
+
+        def check(self, value):
+            return value.isupper()
+
+        def to_json(self, value):
+            return value.lower()
+
+        def to_python(self, value):
+            return value.upper()
+
+    s = TaggedJSONSerializer()
+    assert s.dumps({"a": "ABC"}) == '{"a":"ABC"}'
+    s.register(TagUpper)
+    assert not any(isinstance(t, TagUpper) for t in s._tags_for_type(int))
+    assert s.dumps({"a": "ABC"}) == '{"a":{" up":"abc"}}'
+    assert s.loads(s.dumps({"a": ["ABC", "x"]})) == {"a": ["ABC", "x"]}
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        {"a": 1, "b": [1.5, None, True, "x"], "c": {"d": "e"}},
+        {"a": {" t": [1]}},
+        [{" b": "x"}],
+        {"a": [(1,)]},
+        {"a": Markup("<b>")},
+    ),
+)
+def test_plain_fast_path(data):
+    s = TaggedJSONSerializer()
+    assert s.loads(s.dumps(data)) == data
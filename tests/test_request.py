@@ -68,3 +68,42 @@ def test_trusted_hosts_config(app: Flask) -> None:
     assert r.status_code == 200
     r = client.get(base_url="http://bad.test")
     assert r.status_code == 400
+
+
+def test_iter_json_lines(app: Flask, client: FlaskClient) -> None:
+    @app.post("/")
+    def index():
+        silent = "silent" in request.args
+        size = int(request.args.get("size", 3))
+        return list(request.iter_json_lines(silent=silent, chunk_size=size))
+
+    data = b'{"a": 1}\n\n[1, 2]\r\n"abcdefgh"'
+    rv = client.post("/", data=data, content_type="application/x-ndjson")
+    assert rv.json == [{"a": 1}, [1, 2], "abcdefgh"]
+    rv = client.post("/?size=100", data=data + b"\n", content_type="application/jsonl")
+    assert rv.json == [{"a": 1}, [1, 2], "abcdefgh"]
+
+    rv = client.post("/", data=data, content_type="application/json")
+    assert rv.status_code == 415
+
+    data = b'1\n{"a": \n3'
+    rv = client.post("/", data=data, content_type="application/x-ndjson")
+    assert rv.status_code == 400
+    assert b"line 2" in rv.data
+    rv = client.post("/?silent", data=data, content_type="application/x-ndjson")
+    assert rv.json == [1, 3]
+
+
+def test_iter_json_lines_limits(app: Flask, client: FlaskClient) -> None:
+    @app.post("/")
+    def index():
+        return list(request.iter_json_lines(max_line_size=10, chunk_size=4))
+
+    rv = client.post("/", data=b"1\n2\n", content_type="application/x-ndjson")
+    assert rv.json == [1, 2]
+    rv = client.post("/", data=b'"a long string"', content_type="application/x-ndjson")
+    assert rv.status_code == 413
+
+    app.config["MAX_CONTENT_LENGTH"] = 10
+    rv = client.post("/", data=b"1\n" * 10, content_type="application/x-ndjson")
+    assert rv.status_code == 413
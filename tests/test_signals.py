@@ -1,4 +1,5 @@
 import flask
+from flask.sessions import SessionMixin
 
 
 def test_template_rendered(app, client):
@@ -9,15 +10,18 @@ def test_template_rendered(app, client):
     recorded = []
 
     def record(sender, template, context):
-        recorded.append((template, context))
+        session = context["session"]
+        assert isinstance(session, SessionMixin)
+        recorded.append((template, context, session.get("a")))
 
     flask.template_rendered.connect(record, app)
     try:
         client.get("/")
         assert len(recorded) == 1
-        template, context = recorded[0]
+        template, context, value = recorded[0]
         assert template.name == "simple_template.html"
         assert context["whiskey"] == 42
+        assert value is None
     finally:
         flask.template_rendered.disconnect(record, app)
 
@@ -1,7 +1,9 @@
 import logging
+import os
 
 import pytest
 import werkzeug.serving
+from jinja2 import DictLoader
 from jinja2 import TemplateNotFound
 from markupsafe import Markup
 
@@ -21,6 +23,80 @@ def test_context_processing(app, client):
     assert rv.data == b"<p>23|42"
 
 
+def test_lazy_context_value(app, client):
+    calls = []
+
+    def load():
+        calls.append(1)
+        return 42
+
+    @app.context_processor
+    def context_processor():
+        return {"lazy": flask.templating.LazyValue(load)}
+
+    @app.route("/")
+    def index():
+        unused = flask.render_template_string("{{ 1 }}")
+        used = flask.render_template_string("{{ lazy }} {{ lazy }}")
+        again = flask.render_template_string("{% include 'lazy.html' %}")
+        return f"{unused} {used} {again}"
+
+    app.jinja_loader = DictLoader({"lazy.html": "{{ lazy }}"})
+    assert client.get("/").data == b"1 42 42 42"
+    assert len(calls) == 1
+
+
+def test_lazy_session(app, client):
+    @app.route("/")
+    def index():
+        flask.render_template_string("{{ 1 }}")
+        assert flask.globals.app_ctx._session is None
+        return flask.render_template_string("{{ session.get('a') }}")
+
+    assert client.get("/").data == b"None"
+
+
+def test_fragment_cache(app, client):
+    from flask.templating import FragmentCacheExtension
+
+    app.jinja_env.add_extension(FragmentCacheExtension)
+    source = "{% cache 'a' %}{{ count() }}{{ '<' }}{% endcache %} {{ count() }}"
+    app.jinja_loader = DictLoader({"index.html": source})
+    calls = []
+
+    def count():
+        calls.append(1)
+        return len(calls)
+
+    @app.route("/")
+    def index():
+        return flask.render_template("index.html", count=count)
+
+    @app.route("/stream")
+    def stream():
+        return flask.stream_template("index.html", count=count)
+
+    assert client.get("/").data == b"1&lt; 2"
+    assert client.get("/").data == b"1&lt; 3"
+    assert client.get("/stream").data == b"1&lt; 4"
+
+    app.jinja_env.fragment_cache_bypass = lambda: "nocache" in flask.request.args
+    assert client.get("/?nocache").data == b"5&lt; 6"
+    assert client.get("/").data == b"1&lt; 7"
+
+
+def test_stream_buffer_size(app):
+    source = "{% for i in range(5) %}{{ i }}{% endfor %}{{ stream_flush() }}ab"
+
+    with app.test_request_context():
+        assert "".join(flask.stream_template_string(source)) == "01234ab"
+        assert flask.render_template_string(source) == "01234ab"
+        app.config["TEMPLATES_STREAM_BUFFER_SIZE"] = 2
+        assert list(flask.stream_template_string(source)) == ["01", "23", "4", "ab"]
+        app.config["TEMPLATES_STREAM_BUFFER_SIZE"] = 100
+        assert list(flask.stream_template_string(source)) == ["01234", "ab"]
+
+
 def test_original_win(app, client):
     @app.route("/")
     def index():
@@ -420,6 +496,52 @@ def test_custom_template_loader(client):
     assert rv.data == b"Hello Custom World!"
 
 
+def test_dispatching_loader_index(app):
+    from jinja2 import DictLoader
+
+    calls = []
+
+    class RecordingLoader(DictLoader):
+        def get_source(self, environment, template):
+            calls.append(self.name)
+            return super().get_source(environment, template)
+
+    def make_blueprint(name, mapping):
+        bp = flask.Blueprint(name, __name__)
+        bp.jinja_loader = RecordingLoader(mapping)
+        bp.jinja_loader.name = name
+        return bp
+
+    app.jinja_loader = None
+    app.register_blueprint(make_blueprint("a", {"a.html": "a"}))
+    app.register_blueprint(make_blueprint("b", {"b.html": "b", "a.html": "b"}))
+    loader = app.jinja_env.loader
+    env = app.jinja_env
+
+    assert loader.get_source(env, "b.html")[0] == "b"
+    assert calls == ["a", "b"]
+    calls.clear()
+    assert loader.get_source(env, "b.html")[0] == "b"
+    assert calls == ["b"]
+    calls.clear()
+
+    assert sorted(loader.list_templates()) == ["a.html", "b.html"]
+    assert loader.get_source(env, "a.html")[0] == "a"
+    assert calls == ["a"]
+    calls.clear()
+
+    # registering a blueprint clears the index
+    app.register_blueprint(make_blueprint("c", {"c.html": "c"}))
+    assert loader.get_source(env, "b.html")[0] == "b"
+    assert calls == ["a", "b"]
+    calls.clear()
+
+    # the index is not used with auto reload
+    env.auto_reload = True
+    assert loader.get_source(env, "b.html")[0] == "b"
+    assert calls == ["a", "b"]
+
+
 def test_iterable_loader(app, client):
     @app.context_processor
     def context_processor():
@@ -485,6 +607,27 @@ def test_templates_auto_reload_debug_run(app, monkeypatch):
     assert app.jinja_env.auto_reload
 
 
+def test_templates_auto_reload_interval(app, tmp_path):
+    app.template_folder = str(tmp_path)
+    app.config["TEMPLATES_AUTO_RELOAD"] = True
+    app.config["TEMPLATES_AUTO_RELOAD_INTERVAL"] = 60
+    path = tmp_path / "index.html"
+    path.write_text("a")
+    watcher = app.jinja_env.template_watcher
+
+    try:
+        with app.app_context():
+            assert flask.render_template("index.html") == "a"
+            path.write_text("b")
+            os.utime(path, ns=(0, 0))
+            # Not checked yet, the cached template is used.
+            assert flask.render_template("index.html") == "a"
+            watcher.check()
+            assert flask.render_template("index.html") == "b"
+    finally:
+        watcher.stop()
+
+
 def test_template_loader_debugging(test_apps, monkeypatch):
     from blueprintapp import app
 